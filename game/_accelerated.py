@@ -0,0 +1,267 @@
+"""
+Accelerated kernels for the Go game implementation.
+Compiled with Numba when it is installed; otherwise the callers fall back
+to the pure-Python implementations in the board module.
+"""
+
+import numpy as np
+from .constants import EMPTY, BLACK, WHITE
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so the kernels still import."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def find_group_and_liberties(flat, point, width):
+    """
+    Find the group containing a point and whether it has any liberties.
+
+    Iterative flood fill that collects the group and checks its liberties
+    in a single traversal, returning as soon as a liberty is found. The
+    group is therefore only complete when it has no liberties, which is
+    the only case where callers need it. The board is read through the
+    flattened padded array, whose OFF_BOARD border removes all bounds checks.
+
+    Args:
+        flat (numpy.ndarray): Flattened padded board
+        point (int): Index of the starting stone in flat
+        width (int): Row length of the padded board (board size + 2)
+
+    Returns:
+        tuple: (int32 array of flat indices in the group,
+                bool True if the group has at least one liberty)
+    """
+    group = np.empty(flat.size, dtype=np.int32)
+    color = flat[point]
+    if color == EMPTY:
+        return group[:0], False
+
+    visited = np.zeros(flat.size, dtype=np.uint8)
+    stack = np.empty(flat.size, dtype=np.int32)
+    stack[0] = point
+    visited[point] = 1
+    top = 1
+    count = 0
+
+    while top > 0:
+        top -= 1
+        current = stack[top]
+        group[count] = current
+        count += 1
+
+        for neighbor in (current + 1, current - 1, current + width, current - width):
+            stone = flat[neighbor]
+            if stone == EMPTY:
+                return group[:count], True
+            elif stone == color and visited[neighbor] == 0:
+                visited[neighbor] = 1
+                stack[top] = neighbor
+                top += 1
+
+    return group[:count], False
+
+
+@njit(cache=True)
+def resolve_captures(flat, point, width, zobrist_keys, captured):
+    """
+    Remove the opponent groups captured by the stone at a point.
+
+    Runs the whole capture scan and suicide check of a move in a single
+    compiled call, so the board never crosses back into Python per group.
+    The stone must already be placed at point.
+
+    Args:
+        flat (numpy.ndarray): Flattened padded board, updated in place
+        point (int): Index of the placed stone in flat
+        width (int): Row length of the padded board (board size + 2)
+        zobrist_keys (numpy.ndarray): uint64 keys indexed as [point, color]
+        captured (numpy.ndarray): int32 buffer that receives the captured indices
+
+    Returns:
+        tuple: (int number of stones captured,
+                uint64 Zobrist key XOR of the captured stones,
+                bool True if the placed stone's group has a liberty)
+    """
+    color = flat[point]
+    opponent = WHITE if color == BLACK else BLACK
+    n_captured = 0
+    hash_delta = np.uint64(0)
+
+    for neighbor in (point + 1, point - 1, point + width, point - width):
+        if flat[neighbor] == opponent:
+            group, has_liberty = find_group_and_liberties(flat, neighbor, width)
+            if not has_liberty:
+                # Removed at once, so a group reached twice is only captured once
+                for stone in group:
+                    flat[stone] = EMPTY
+                    captured[n_captured] = stone
+                    hash_delta ^= zobrist_keys[stone, opponent]
+                    n_captured += 1
+
+    if n_captured:
+        return n_captured, hash_delta, True
+
+    _, has_liberty = find_group_and_liberties(flat, point, width)
+    return n_captured, hash_delta, has_liberty
+
+
+@njit(cache=True)
+def label_empty_regions(flat, width):
+    """
+    Label the connected empty regions of the board and the colors bordering each.
+
+    Args:
+        flat (numpy.ndarray): Flattened padded board
+        width (int): Row length of the padded board (board size + 2)
+
+    Returns:
+        tuple: (int32 array with the region label of each point in flat, -1 for stones
+                and the border, int8 array with the OR of the stone colors bordering
+                each region; BLACK | WHITE means both colors touch it)
+    """
+    labels = np.full(flat.size, -1, dtype=np.int32)
+    borders = np.zeros(flat.size, dtype=np.int8)
+    stack = np.empty(flat.size, dtype=np.int32)
+    n_regions = 0
+
+    for start in range(flat.size):
+        if flat[start] != EMPTY or labels[start] != -1:
+            continue
+
+        label = n_regions
+        n_regions += 1
+        labels[start] = label
+        stack[0] = start
+        top = 1
+        border = 0
+
+        while top > 0:
+            top -= 1
+            current = stack[top]
+
+            for neighbor in (current + 1, current - 1, current + width, current - width):
+                stone = flat[neighbor]
+                if stone == EMPTY:
+                    if labels[neighbor] == -1:
+                        labels[neighbor] = label
+                        stack[top] = neighbor
+                        top += 1
+                elif stone == BLACK or stone == WHITE:
+                    border |= stone
+
+        borders[label] = border
+
+    return labels, borders[:n_regions]
+
+
+# Width of the column strips correlate_constant works through, so that a
+# strip and its halo stay cache-resident on boards wider than 32 points
+CORRELATE_TILE = 32
+
+
+@njit(parallel=True, cache=True)
+def correlate_constant(values, kernel, out):
+    """
+    Correlate a 2-D array with a square odd-sized kernel centered on each point.
+
+    Points outside the array count as zero: the values are copied once into
+    a zero-padded buffer, so the stencil reads every neighbor without bounds
+    checks. The columns are processed in strips CORRELATE_TILE wide, the
+    rows of each strip in parallel, and zero kernel weights are skipped, so
+    sparse ring kernels only touch their ring. Boards up to 32 points wide
+    are a single strip.
+
+    Args:
+        values (numpy.ndarray): 2-D float array
+        kernel (numpy.ndarray): Square float kernel of odd size
+        out (numpy.ndarray): Array of the same shape as values that receives the result
+
+    Returns:
+        numpy.ndarray: out
+    """
+    rows, cols = values.shape
+    size = kernel.shape[0]
+    radius = size // 2
+    tile = CORRELATE_TILE
+
+    padded = np.zeros((rows + 2 * radius, cols + 2 * radius), dtype=values.dtype)
+    padded[radius:radius + rows, radius:radius + cols] = values
+
+    for tile_x in range(0, cols, tile):
+        tile_end = min(tile_x + tile, cols)
+        for y in prange(rows):
+            for x in range(tile_x, tile_end):
+                total = 0.0
+                for ky in range(size):
+                    for kx in range(size):
+                        weight = kernel[ky, kx]
+                        if weight != 0.0:
+                            total += weight * padded[y + ky, x + kx]
+                out[y, x] = total
+
+    return out
+
+
+@njit(cache=True)
+def influence_squares(influence, board, cell_size, x_offset, y_offset):
+    """
+    Compute the influence totals and the squares that show influence on the board.
+
+    Each empty point with an influence of at least 0.1 in magnitude gets a
+    square centered on it, sized and made opaque in proportion to its
+    influence, normalized by the largest magnitude on the board (at least
+    1). The arithmetic is done in float32, as the NumPy version in main does.
+
+    Args:
+        influence (numpy.ndarray): float32 influence map, positive for black
+        board (numpy.ndarray): Board array without padding
+        cell_size (int): Distance in pixels between two points
+        x_offset (int): x coordinate of the first column on the target surface
+        y_offset (int): y coordinate of the first row on the target surface
+
+    Returns:
+        tuple: (float total black influence, float total white influence,
+                int32 array with one (left, top, size, alpha, shade) row per square,
+                the shade being the gray level of the square: 0 for black, 255 for white)
+    """
+    rows, cols = influence.shape
+
+    black_total = 0.0
+    white_total = 0.0
+    max_influence = np.float32(1.0)
+    for y in range(rows):
+        for x in range(cols):
+            value = influence[y, x]
+            black_total += max(value, 0.0)
+            white_total += max(-value, 0.0)
+            max_influence = max(max_influence, abs(value))
+
+    squares = np.empty((rows * cols, 5), dtype=np.int32)
+    count = 0
+    for y in range(rows):
+        for x in range(cols):
+            value = influence[y, x]
+            if board[y, x] != EMPTY or abs(value) < 0.1:
+                continue
+
+            strength = np.float32(abs(value) / max_influence)
+            size_factor = np.float32(0.3) + np.float32(0.6) * min(np.float32(1.0), strength)
+            size = max(int(np.float32(cell_size) * size_factor), 8)
+            squares[count, 0] = x_offset + x * cell_size - size // 2
+            squares[count, 1] = y_offset + y * cell_size - size // 2
+            squares[count, 2] = size
+            squares[count, 3] = int(min(np.float32(255.0), np.float32(100.0) + np.float32(155.0) * strength))
+            squares[count, 4] = 255 * (value < 0)
+            count += 1
+
+    return black_total, white_total, squares[:count]
@@ -4,7 +4,66 @@ Handles the board representation and basic game mechanics.
 """
 
 import numpy as np
-from .constants import EMPTY, BLACK, WHITE
+from .constants import EMPTY, BLACK, WHITE, OFF_BOARD
+from ._accelerated import NUMBA_AVAILABLE, find_group_and_liberties, resolve_captures
+
+# Zobrist keys per board size, shared by all boards of that size
+_ZOBRIST_TABLES = {}
+
+# Neighbor index tables per board size, shared by all boards of that size
+_NEIGHBOR_TABLES = {}
+
+# Maximum number of positions kept in a board's legal-moves cache
+_LEGAL_MOVES_CACHE_LIMIT = 2**15
+
+# Shared, read-only captured points of a move that captured nothing
+_NO_CAPTURES = np.empty(0, dtype=np.int32)
+_NO_CAPTURES.flags.writeable = False
+
+def _zobrist_table(size):
+    """
+    Get the Zobrist keys for a board size, creating them on first use.
+    
+    Args:
+        size (int): Size of the board
+    
+    Returns:
+        numpy.ndarray: uint64 keys indexed as table[point, color], where point is an
+                       index into the flattened padded board; EMPTY and border keys are 0
+    """
+    if size not in _ZOBRIST_TABLES:
+        width = size + 2
+        rng = np.random.default_rng(size)
+        table = np.zeros((width, width, 3), dtype=np.uint64)
+        table[1:-1, 1:-1, BLACK] = rng.integers(1, 2**63, size=(size, size), dtype=np.uint64)
+        table[1:-1, 1:-1, WHITE] = rng.integers(1, 2**63, size=(size, size), dtype=np.uint64)
+        _ZOBRIST_TABLES[size] = table.reshape(width * width, 3)
+    return _ZOBRIST_TABLES[size]
+
+def _neighbor_table(size):
+    """
+    Get the on-board neighbors of every point for a board size, creating them on first use.
+    
+    Args:
+        size (int): Size of the board
+    
+    Returns:
+        list: Tuple of on-board neighbor indices for each index into the flattened
+              padded board; border points have no neighbors
+    """
+    if size not in _NEIGHBOR_TABLES:
+        width = size + 2
+        table = [()] * (width * width)
+        for y in range(size):
+            for x in range(size):
+                point = (y + 1) * width + x + 1
+                table[point] = tuple(
+                    neighbor
+                    for neighbor, on_board in ((point + 1, x + 1 < size), (point - 1, x > 0),
+                                               (point + width, y + 1 < size), (point - width, y > 0))
+                    if on_board)
+        _NEIGHBOR_TABLES[size] = table
+    return _NEIGHBOR_TABLES[size]
 
 class Board:
     def __init__(self, size):
@@ -15,10 +74,41 @@ class Board:
             size (int): Size of the board (typically 9, 13, or 19)
         """
         self.size = size
-        self.board = np.zeros((size, size), dtype=int)
-        self.last_board_state = None  # Used for ko rule checking
-        self.previous_board_states = []  # Store previous board states for ko rule
+        # The board is a view into an array with an OFF_BOARD border, so
+        # neighbor lookups in the padded array never need bounds checks
+        self.padded_board = np.full((size + 2, size + 2), OFF_BOARD, dtype=np.int8)
+        self.board = self.padded_board[1:-1, 1:-1]
+        self.board.fill(EMPTY)
+        # 1-D view of the padded board; (x, y) is at (y + 1) * (size + 2) + x + 1
+        # and its neighbors are at +-1 and +-(size + 2)
+        self.flat_board = self.padded_board.reshape(-1)
+        self._width = size + 2
+        self.neighbor_indices = _neighbor_table(size)  # On-board neighbor indices of each flat_board point
+        self.previous_board_states = set()  # Zobrist hashes of previous board states for ko rule
+        self._state_order = []  # The same hashes, oldest first
+        self._history_key = None  # Frozen copy of previous_board_states, built on demand
         self.ko_position = None  # Store the position of the ko (if any)
+        self._last_move = None  # Undo record of the last successful move
+        self.version = 0  # Bumped whenever the stones on the board change
+        self._zobrist_keys = _zobrist_table(size)
+        self._zobrist = self._zobrist_keys.tolist()  # Same keys as Python ints for scalar lookups
+        self._hash = 0  # Zobrist hash of the current position
+        self._last_hash = None  # Zobrist hash before the last successful move
+        self.stone_counts = {BLACK: 0, WHITE: 0}  # Number of stones of each color on the board
+        self.last_captured = 0  # Number of stones captured by the last successful move
+        self._visited = [0] * len(self.flat_board)  # Scratch visited marks for group searches
+        self._generation = 0  # Mark value of the current group search
+        self._legal_moves_cache = {}  # Legal moves keyed by position and color
+        self._captured = np.empty(len(self.flat_board), dtype=np.int32)  # Scratch buffer for captured points
+    
+    def _point(self, x, y):
+        """Convert (x, y) coordinates to an index into flat_board."""
+        return (y + 1) * self._width + x + 1
+    
+    def _coords(self, point):
+        """Convert an index into flat_board to (x, y) coordinates."""
+        y, x = divmod(point, self._width)
+        return x - 1, y - 1
     
     def get_stone(self, x, y):
         """
@@ -45,81 +135,181 @@ class Board:
             color (int): Stone color (BLACK or WHITE)
         
         Returns:
-            bool: True if the stone was placed successfully, False otherwise
+            bool: True if the stone was placed successfully, False otherwise.
+                  The number of stones it captured is left in last_captured.
         """
         if not (0 <= x < self.size and 0 <= y < self.size):
             return False
         
-        if self.board[y, x] != EMPTY:
+        flat = self.flat_board
+        width = self._width
+        zobrist = self._zobrist
+        point = (y + 1) * width + x + 1
+        
+        if flat[point] != EMPTY:
             return False
         
         # Check for ko rule - cannot play at ko_position
         if self.ko_position is not None and (x, y) == self.ko_position:
             return False
         
-        # Save the current board state for ko rule checking
-        self.last_board_state = self.board.copy()
+        # The placed point, the captured points and the previous hash are
+        # enough to roll the move back in place
+        previous_hash = self._hash
         
         # Place the stone
-        self.board[y, x] = color
+        flat[point] = color
+        self._hash ^= zobrist[point][color]
+        self.stone_counts[color] += 1
         
-        # Check for captures
         opponent = WHITE if color == BLACK else BLACK
-        captured = []
-        
-        # Check adjacent groups for captures
-        for nx, ny in [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]:
-            if 0 <= nx < self.size and 0 <= ny < self.size and self.board[ny, nx] == opponent:
-                group = self.find_group(nx, ny)
-                if not self.has_liberties(group):
-                    captured.extend(group)
-        
-        # Remove captured stones
-        for cx, cy in captured:
-            self.board[cy, cx] = EMPTY
-        
-        # Check if the placed stone's group has liberties
-        group = self.find_group(x, y)
-        if not self.has_liberties(group):
-            # If no liberties and no captures, this is a suicide move
-            if not captured:
-                # Revert the board state
-                self.board = self.last_board_state
-                return False
+        captured = self._captured
+        n_captured = 0
+        neighbors = self.neighbor_indices[point]
+        
+        # Fast path for the common quiet move: with no opponent neighbor
+        # nothing can be captured, and an empty neighbor is a liberty, so
+        # neither the capture scan nor the suicide check is needed
+        has_opponent_neighbor = False
+        has_empty_neighbor = False
+        for neighbor in neighbors:
+            stone = flat[neighbor]
+            if stone == opponent:
+                has_opponent_neighbor = True
+            elif stone == EMPTY:
+                has_empty_neighbor = True
+        
+        if has_opponent_neighbor or not has_empty_neighbor:
+            if NUMBA_AVAILABLE:
+                # Capture scan, hash update and suicide check in one compiled call
+                n_captured, hash_delta, has_liberties = resolve_captures(
+                    flat, point, width, self._zobrist_keys, captured)
+                if n_captured:
+                    self._hash ^= int(hash_delta)
+            else:
+                # Check adjacent groups for captures. A captured group is removed at
+                # once: its stones cannot touch another opponent group, so the other
+                # checks are unaffected, and a group reached from two sides is only
+                # captured the first time.
+                for neighbor in neighbors:
+                    if flat[neighbor] == opponent:
+                        group, has_liberties = self._group_and_liberties(neighbor)
+                        if not has_liberties:
+                            flat[group] = EMPTY
+                            captured[n_captured:n_captured + len(group)] = group
+                            n_captured += len(group)
+                
+                if n_captured:
+                    self._hash ^= int(np.bitwise_xor.reduce(
+                        self._zobrist_keys[captured[:n_captured], opponent]))
+                
+                # Check if the placed stone's group has liberties
+                _, has_liberties = self._group_and_liberties(point)
+            
+            if n_captured:
+                self.stone_counts[opponent] -= n_captured
+            
+            if not has_liberties:
+                # If no liberties and no captures, this is a suicide move
+                if not n_captured:
+                    # Revert the board state
+                    self._revert(point, captured[:0], previous_hash)
+                    return False
+        
+        captured_points = captured[:n_captured]
         
         # Check for ko situation - if exactly one stone was captured
+        previous_ko_position = self.ko_position
         self.ko_position = None  # Reset ko position
-        if len(captured) == 1:
+        if n_captured == 1:
             # Check if the capturing stone is surrounded by opponent stones on 3 sides
             # and the 4th side is where the capture occurred
-            cx, cy = captured[0]  # The position of the captured stone
+            captured_point = int(captured[0])  # The position of the captured stone
             surrounding_opponent_count = 0
             
-            for nx, ny in [(cx+1, cy), (cx-1, cy), (cx, cy+1), (cx, cy-1)]:
-                if 0 <= nx < self.size and 0 <= ny < self.size:
-                    if self.board[ny, nx] == opponent:
-                        surrounding_opponent_count += 1
+            for neighbor in self.neighbor_indices[captured_point]:
+                if flat[neighbor] == opponent:
+                    surrounding_opponent_count += 1
             
             # If the capturing stone is surrounded by opponent stones on 3 sides,
             # then the captured position becomes a ko
             if surrounding_opponent_count == 3:
-                self.ko_position = (cx, cy)
+                self.ko_position = self._coords(captured_point)
         
         # Check if this move would recreate a previous board state
-        current_board_state = self.board.tobytes()
+        current_board_state = self._hash
         if current_board_state in self.previous_board_states:
             # This move would recreate a previous board state, which is not allowed
             # Revert the board state
-            self.board = self.last_board_state
+            self._revert(point, captured_points, previous_hash)
+            self.ko_position = previous_ko_position
             return False
         
         # Add the current board state to the history
-        self.previous_board_states.append(current_board_state)
+        self.previous_board_states.add(current_board_state)
+        self._state_order.append(current_board_state)
+        self._history_key = None
         
         # Limit the history to prevent memory issues (keep last 8 states)
-        if len(self.previous_board_states) > 8:
-            self.previous_board_states.pop(0)
+        evicted_state = None
+        if len(self._state_order) > 8:
+            evicted_state = self._state_order.pop(0)
+            self.previous_board_states.discard(evicted_state)
         
+        # The scratch buffer is reused by the next move, so keep a copy;
+        # quiet moves share one empty array instead of allocating
+        if n_captured:
+            captured_points = captured_points.copy()
+        else:
+            captured_points = _NO_CAPTURES
+        self._last_move = (point, captured_points, previous_hash,
+                           previous_ko_position, evicted_state, self._last_hash)
+        self._last_hash = previous_hash
+        self.last_captured = n_captured
+        self.version += 1
+        return True
+    
+    def _revert(self, point, captured, previous_hash):
+        """
+        Take back a stone and put back the stones it captured.
+        
+        Args:
+            point (int): flat_board index of the placed stone
+            captured (numpy.ndarray): flat_board indices of the captured stones
+            previous_hash (int): Zobrist hash of the position before the move
+        """
+        flat = self.flat_board
+        color = int(flat[point])
+        opponent = WHITE if color == BLACK else BLACK
+        flat[point] = EMPTY
+        flat[captured] = opponent
+        self.stone_counts[color] -= 1
+        self.stone_counts[opponent] += len(captured)
+        self._hash = previous_hash
+    
+    def undo_move(self):
+        """
+        Undo the last successful place_stone call.
+        Only a single level of undo is kept.
+        
+        Returns:
+            bool: True if a move was undone, False if there was nothing to undo
+        """
+        if self._last_move is None:
+            return False
+        
+        point, captured, previous_hash, ko_position, evicted_state, last_hash = self._last_move
+        self._revert(point, captured, previous_hash)
+        self.ko_position = ko_position
+        self._last_hash = last_hash
+        self.previous_board_states.discard(self._state_order.pop())
+        self._history_key = None
+        if evicted_state is not None:
+            self.previous_board_states.add(evicted_state)
+            self._state_order.insert(0, evicted_state)
+        self._last_move = None
+        self.last_captured = 0
+        self.version += 1
         return True
     
     def find_group(self, x, y):
@@ -133,27 +323,72 @@ class Board:
         Returns:
             list: List of (x, y) coordinates in the group
         """
-        color = self.board[y, x]
+        group, _ = self._find_group_and_liberties(self._point(x, y))
+        return [self._coords(point) for point in group]
+    
+    def _find_group_and_liberties(self, point, stop_at_liberty=False):
+        """
+        Find the group at a flat_board index and check its liberties in the same pass.
+        
+        Args:
+            point (int): Index into flat_board
+            stop_at_liberty (bool): Return as soon as a liberty is found; the
+                                    group is then incomplete
+        
+        Returns:
+            tuple: (list of flat_board indices in the group, bool has liberties)
+        """
+        flat = self.flat_board
+        neighbors = self.neighbor_indices
+        color = flat[point]
         if color == EMPTY:
-            return []
+            return [], False
+        
+        # Points stamped with the current generation have been visited,
+        # so the scratch buffer never needs clearing between searches
+        self._generation += 1
+        generation = self._generation
+        visited = self._visited
+        visited[point] = generation
         
         group = []
-        visited = set()
+        has_liberties = False
+        stack = [point]
         
-        def dfs(cx, cy):
-            if (cx, cy) in visited:
-                return
+        while stack:
+            current = stack.pop()
+            group.append(current)
             
-            visited.add((cx, cy))
-            if 0 <= cx < self.size and 0 <= cy < self.size and self.board[cy, cx] == color:
-                group.append((cx, cy))
-                dfs(cx+1, cy)
-                dfs(cx-1, cy)
-                dfs(cx, cy+1)
-                dfs(cx, cy-1)
+            for neighbor in neighbors[current]:
+                stone = flat[neighbor]
+                if stone == EMPTY:
+                    if stop_at_liberty:
+                        return group, True
+                    has_liberties = True
+                elif stone == color and visited[neighbor] != generation:
+                    visited[neighbor] = generation
+                    stack.append(neighbor)
         
-        dfs(x, y)
-        return group
+        return group, has_liberties
+    
+    def _group_and_liberties(self, point):
+        """
+        Check whether the group at a flat_board index has liberties.
+        Uses the compiled kernel when Numba is available. The search stops at
+        the first liberty, so the group is only complete when it has none.
+        
+        Args:
+            point (int): Index into flat_board
+        
+        Returns:
+            tuple: (flat_board indices in the group as an int32 array or a list,
+                    bool has liberties)
+        """
+        if NUMBA_AVAILABLE:
+            group, has_liberties = find_group_and_liberties(self.flat_board, point, self._width)
+            return group, bool(has_liberties)
+        
+        return self._find_group_and_liberties(point, stop_at_liberty=True)
     
     def has_liberties(self, group):
         """
@@ -165,21 +400,24 @@ class Board:
         Returns:
             bool: True if the group has liberties, False otherwise
         """
+        flat = self.flat_board
+        neighbors = self.neighbor_indices
         for x, y in group:
-            for nx, ny in [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]:
-                if 0 <= nx < self.size and 0 <= ny < self.size and self.board[ny, nx] == EMPTY:
+            for neighbor in neighbors[self._point(x, y)]:
+                if flat[neighbor] == EMPTY:
                     return True
         return False
     
     def is_ko(self):
         """
-        Check if the current move violates the ko rule.
-        This is now handled directly in place_stone with ko_position and board state history.
+        Check if the last move recreated the position it was played from.
+        Ko itself is enforced in place_stone with ko_position and the board state history;
+        this only compares the cached Zobrist hashes.
         
         Returns:
-            bool: True if the move violates the ko rule, False otherwise
+            bool: True if the position repeats the previous one, False otherwise
         """
-        return False  # Ko is now handled with ko_position in place_stone
+        return self._last_hash is not None and self._hash == self._last_hash
     
     def get_legal_moves(self, color):
         """
@@ -192,27 +430,67 @@ class Board:
             list: List of (x, y) coordinates for legal moves
         """
         legal_moves = []
+        last_move = self._last_move
+        last_captured = self.last_captured
+        version = self.version
+        
+        # Only empty points outside the ko position are candidates
+        candidates = self.board == EMPTY
+        if self.ko_position is not None:
+            ko_x, ko_y = self.ko_position
+            candidates[ko_y, ko_x] = False
+        
+        for y, x in np.argwhere(candidates).tolist():
+            # Test the move in place and roll it back
+            if self.place_stone(x, y, color):
+                legal_moves.append((x, y))
+                self.undo_move()
+        
+        # Every probe was undone, so the position has not changed
+        self._last_move = last_move
+        self.last_captured = last_captured
+        self.version = version
+        return legal_moves
+    
+    def get_legal_moves_cached(self, color):
+        """
+        Get all legal moves for the specified color, reusing earlier results
+        for positions that have been seen before.
         
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.board[y, x] == EMPTY and (self.ko_position is None or (x, y) != self.ko_position):
-                    # Create a copy of the board to test the move
-                    board_copy = Board(self.size)
-                    board_copy.board = self.board.copy()
-                    board_copy.last_board_state = self.last_board_state.copy() if self.last_board_state is not None else None
-                    board_copy.ko_position = self.ko_position
-                    board_copy.previous_board_states = self.previous_board_states.copy()
-                    
-                    if board_copy.place_stone(x, y, color):
-                        legal_moves.append((x, y))
+        Legality depends on the stones, the ko position and the recent
+        position history, so all of them are part of the cache key.
         
+        Args:
+            color (int): Stone color (BLACK or WHITE)
+        
+        Returns:
+            tuple: Tuple of (x, y) coordinates for legal moves
+        """
+        # The history is frozen once per position rather than on every lookup
+        if self._history_key is None:
+            self._history_key = frozenset(self.previous_board_states)
+        key = (self._hash, color, self.ko_position, self._history_key)
+        legal_moves = self._legal_moves_cache.get(key)
+        if legal_moves is None:
+            if len(self._legal_moves_cache) >= _LEGAL_MOVES_CACHE_LIMIT:
+                # Drop the oldest entry
+                del self._legal_moves_cache[next(iter(self._legal_moves_cache))]
+            legal_moves = tuple(self.get_legal_moves(color))
+            self._legal_moves_cache[key] = legal_moves
         return legal_moves
     
     def clear(self):
         """
         Clear the board.
         """
-        self.board = np.zeros((self.size, self.size), dtype=int)
-        self.last_board_state = None
-        self.previous_board_states = []
+        self.board.fill(EMPTY)
+        self.previous_board_states = set()
+        self._state_order = []
+        self._history_key = None
         self.ko_position = None
+        self._last_move = None
+        self.version += 1
+        self._hash = 0
+        self._last_hash = None
+        self.stone_counts = {BLACK: 0, WHITE: 0}
+        self.last_captured = 0
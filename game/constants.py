@@ -10,6 +10,9 @@ EMPTY = 0
 BLACK = 1
 WHITE = 2
 
+# Sentinel stored around the edge of the padded board array
+OFF_BOARD = 3
+
 # Territory types
 BLACK_TERRITORY = BLACK
 WHITE_TERRITORY = WHITE
@@ -19,6 +22,7 @@ POTENTIAL_WHITE_TERRITORY = 4
 # UI constants
 CELL_SIZE = 30  # Size of each cell in pixels
 BOARD_PADDING = 40  # Padding around the board in pixels
+FPS = 30  # Frame rate cap of the game loop
 
 # Territory visualization settings
 TERRITORY_MARKER_SIZE_RATIO = 0.6  # Size of territory markers relative to cell size (0.0-1.0)
@@ -3,10 +3,210 @@ Game state module for the Go game implementation.
 Manages the game flow, player turns, and game rules.
 """
 
-from .constants import BLACK, WHITE, EMPTY
+from .constants import BLACK, WHITE, EMPTY, OFF_BOARD
+from ._accelerated import NUMBA_AVAILABLE, label_empty_regions, correlate_constant
 import numpy as np
 
+try:
+    from scipy import ndimage
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import cupy
+    from cupyx.scipy import ndimage as cupy_ndimage
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# 4-connectivity for labelling empty regions
+_CROSS = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]])
+
+# Influence maps are float32: the values are small and only thresholded or
+# drawn, and half-width floats halve the memory traffic of every stencil pass
+_INFLUENCE_DTYPE = np.float32
+
+# Constants for influence calculation
+_DIRECT_INFLUENCE = 1.5
+_DIAGONAL_INFLUENCE = 0.7
+_DECAY_FACTOR = 0.8
+_MAX_DISTANCE = 6
+_GROUP_FACTOR = 0.2
+
+# Area counted by the group-based influence boost, pre-scaled so that one
+# correlation with the direct influence yields the boost itself
+_GROUP_KERNEL = np.full((5, 5), _GROUP_FACTOR / _DIRECT_INFLUENCE, dtype=_INFLUENCE_DTYPE)
+
+# Constant lookups for the player to move next and the player names
+_OPPONENT = {BLACK: WHITE, WHITE: BLACK}
+_NAME = {BLACK: "Black", WHITE: "White"}
+
+# Coordinate recorded in the move history for a pass
+PASS = -1
+
+# Influence ring kernels and their per-point scale maps per board size
+_INFLUENCE_RINGS = {}
+
+def _ring_kernel(distance, diagonal_weight):
+    """
+    Build the weights of the influence ring at a distance.
+    
+    Args:
+        distance (int): Ring distance
+        diagonal_weight (float): Weight of points off the center row and column
+    
+    Returns:
+        numpy.ndarray: (2 * distance + 1) square kernel; points at Manhattan or Chebyshev
+                       distance equal to distance have weight 1 on the center row and
+                       column and diagonal_weight elsewhere, all other points 0
+    """
+    offsets = np.abs(np.arange(-distance, distance + 1))
+    dy, dx = np.meshgrid(offsets, offsets, indexing='ij')
+    ring = (dx + dy == distance) | (np.maximum(dx, dy) == distance)
+    weights = np.where((dx == 0) | (dy == 0), 1.0, diagonal_weight)
+    return np.where(ring, weights, 0.0).astype(_INFLUENCE_DTYPE)
+
+def _influence_rings(size):
+    """
+    Get the influence ring kernels for a board size, creating them on first use.
+    
+    The weight of the on-board part of each ring only depends on the board
+    size, so it is computed once here rather than on every influence call,
+    and folded together with the decay of the ring into a single scale map.
+    
+    Args:
+        size (int): Size of the board
+    
+    Returns:
+        list: (kernel, scale) for distances 1 to _MAX_DISTANCE, where scale is
+              the decayed direct influence divided by the total weight of the
+              on-board ring points around each point. A point whose ring is
+              entirely off the board has a ring sum of 0 and any finite scale.
+    """
+    if size not in _INFLUENCE_RINGS:
+        on_board = np.ones((size, size), dtype=_INFLUENCE_DTYPE)
+        rings = []
+        for distance in range(1, _MAX_DISTANCE + 1):
+            kernel = _ring_kernel(distance, _DIAGONAL_INFLUENCE / _DIRECT_INFLUENCE)
+            count = _correlate(on_board, kernel, np.empty((size, size), dtype=_INFLUENCE_DTYPE))
+            count[count == 0] = 1
+            scale = (_DIRECT_INFLUENCE * (_DECAY_FACTOR ** distance) / count).astype(_INFLUENCE_DTYPE)
+            scale.flags.writeable = False
+            rings.append((kernel, scale))
+        _INFLUENCE_RINGS[size] = rings
+    return _INFLUENCE_RINGS[size]
+
+def _correlate(values, kernel, out):
+    """
+    Correlate a 2-D array with a square odd-sized kernel centered on each point.
+    Points outside the array count as zero.
+    
+    Args:
+        values (numpy.ndarray): 2-D float array
+        kernel (numpy.ndarray): Square kernel of odd size
+        out (numpy.ndarray): Float array of the same shape that receives the result
+    
+    Returns:
+        numpy.ndarray: out, holding the kernel-weighted sum of the neighborhood of each point
+    """
+    # A single compiled stencil pass, preferring Numba as for territory labelling
+    if NUMBA_AVAILABLE:
+        return correlate_constant(values, kernel, out)
+    
+    if SCIPY_AVAILABLE:
+        return ndimage.correlate(values, kernel, output=out, mode='constant', cval=0.0)
+    
+    radius = kernel.shape[0] // 2
+    rows, cols = values.shape
+    padded = np.zeros((rows + 2 * radius, cols + 2 * radius), dtype=values.dtype)
+    padded[radius:radius + rows, radius:radius + cols] = values
+    
+    out.fill(0)
+    for ky, kx in zip(*np.nonzero(kernel)):
+        out += kernel[ky, kx] * padded[ky:ky + rows, kx:kx + cols]
+    return out
+
+def _correlate_batch(values, kernel, xp, batch_ndimage):
+    """
+    Correlate every board of a stack with the same kernel.
+    
+    Args:
+        values (array): Float array of shape (number of boards, size, size)
+        kernel (numpy.ndarray): Square kernel of odd size
+        xp (module): Array module of values, numpy or cupy
+        batch_ndimage (module): ndimage module that correlates the whole stack in
+                                one call, or None to correlate board by board
+    
+    Returns:
+        array: Array of the same shape and type as values
+    """
+    if batch_ndimage is None:
+        out = np.empty_like(values)
+        for board_values, board_out in zip(values, out):
+            _correlate(board_values, kernel, board_out)
+        return out
+    
+    # A kernel of depth one never mixes neighboring boards of the stack
+    return batch_ndimage.correlate(values, xp.asarray(kernel[np.newaxis]), mode='constant', cval=0.0)
+
+def calculate_influence_batch(boards, backend='numpy'):
+    """
+    Calculate the influence maps of several positions of the same size at once.
+    Gives the same maps as GameState.calculate_influence, but runs each stencil
+    pass over the whole stack of boards, on the GPU when backend is 'cupy'.
+    
+    Args:
+        boards (list): Board objects of the same size
+        backend (str): 'numpy' for the CPU or 'cupy' for the GPU (requires CuPy)
+    
+    Returns:
+        numpy.ndarray: float32 array of shape (number of boards, size, size) with
+                       one influence map per board
+    
+    Raises:
+        ValueError: If boards is empty, the boards differ in size or the backend is unknown
+    """
+    if not boards:
+        raise ValueError("calculate_influence_batch needs at least one board")
+    size = boards[0].size
+    if any(board.size != size for board in boards):
+        raise ValueError("calculate_influence_batch needs boards of the same size")
+    
+    if backend == 'cupy':
+        if not CUPY_AVAILABLE:
+            raise RuntimeError("The 'cupy' backend requires CuPy")
+        xp, batch_ndimage = cupy, cupy_ndimage
+    elif backend == 'numpy':
+        # Prefer the compiled per-board stencil as for a single position
+        xp = np
+        batch_ndimage = ndimage if SCIPY_AVAILABLE and not NUMBA_AVAILABLE else None
+    else:
+        raise ValueError(f"Unknown influence backend: {backend}")
+    
+    # Copied to the device once; only the finished maps come back
+    stack = xp.asarray(np.stack([board.board for board in boards]))
+    empty = stack == EMPTY
+    influence = (stack == BLACK).astype(_INFLUENCE_DTYPE) - (stack == WHITE).astype(_INFLUENCE_DTYPE)
+    influence *= _DIRECT_INFLUENCE
+    
+    # The same ring passes and group boost as calculate_influence
+    propagated = influence.copy()
+    for kernel, scale in _influence_rings(size):
+        ring_sum = _correlate_batch(influence, kernel, xp, batch_ndimage)
+        ring_sum *= xp.asarray(scale)
+        propagated += xp.where(empty, ring_sum, 0)
+    
+    ring_sum = _correlate_batch(influence, _GROUP_KERNEL, xp, batch_ndimage)
+    propagated += xp.where(empty, ring_sum, 0)
+    
+    return cupy.asnumpy(propagated) if xp is not np else propagated
+
 class GameState:
+    __slots__ = ('board', 'current_player', 'pass_count', '_moves', '_history_len',
+                 'captured_stones', '_direct_influence', '_ring_sum', '_territory_cache',
+                 '_influence_cache', '_potential_cache', '_cache_version')
+    
     def __init__(self, board):
         """
         Initialize a new game state.
@@ -17,8 +217,15 @@ class GameState:
         self.board = board
         self.current_player = BLACK  # Black goes first
         self.pass_count = 0  # Count of consecutive passes
-        self.move_history = []  # History of moves
+        self._moves = np.empty((256, 3), dtype=np.int16)  # Move history buffer, grown by doubling
+        self._history_len = 0  # Number of moves recorded in the buffer
         self.captured_stones = {BLACK: 0, WHITE: 0}  # Count of captured stones by each player
+        self._direct_influence = np.zeros((board.size, board.size), dtype=_INFLUENCE_DTYPE)  # Scratch buffer for calculate_influence
+        self._ring_sum = np.zeros((board.size, board.size), dtype=_INFLUENCE_DTYPE)  # Scratch buffer for calculate_influence
+        self._territory_cache = None  # Result of calculate_territory for the current position
+        self._influence_cache = None  # Result of calculate_influence for the current position
+        self._potential_cache = None  # Result of get_potential_territory for the current position
+        self._cache_version = board.version  # Board version the cached results belong to
     
     def place_stone(self, x, y):
         """
@@ -31,33 +238,68 @@ class GameState:
         Returns:
             bool: True if the move was valid, False otherwise
         """
-        # Count stones before the move to calculate captures
-        stones_before = self.count_stones()
-        
         # Try to place the stone
         if not self.board.place_stone(x, y, self.current_player):
             return False
         
         # Record the move
-        self.move_history.append((x, y, self.current_player))
+        self._record_move(x, y, self.current_player)
+        self.invalidate()
         
         # Reset pass count
         self.pass_count = 0
         
-        # Count stones after the move to calculate captures
-        stones_after = self.count_stones()
-        
-        # Calculate captures
-        opponent = WHITE if self.current_player == BLACK else BLACK
-        captured = stones_before[opponent] - stones_after[opponent]
-        if captured > 0:
-            self.captured_stones[self.current_player] += captured
+        # Record captures; the board reports how many stones the move took
+        self.captured_stones[self.current_player] += self.board.last_captured
         
         # Switch player
-        self.current_player = WHITE if self.current_player == BLACK else BLACK
+        self.current_player = _OPPONENT[self.current_player]
         
         return True
     
+    @property
+    def move_history(self):
+        """
+        History of moves, one (x, y, color) row per move.
+        Passes are recorded with x and y set to PASS.
+        
+        Returns:
+            numpy.ndarray: int16 array of shape (number of moves, 3)
+        """
+        return self._moves[:self._history_len]
+    
+    def _record_move(self, x, y, color):
+        """Append a move to the history, doubling the buffer when it is full."""
+        if self._history_len == len(self._moves):
+            self._moves = np.resize(self._moves, (2 * len(self._moves), 3))
+        self._moves[self._history_len] = (x, y, color)
+        self._history_len += 1
+    
+    def get_legal_moves(self):
+        """
+        Get all legal moves for the current player.
+        
+        Returns:
+            tuple: Tuple of (x, y) coordinates for legal moves
+        """
+        return self.board.get_legal_moves_cached(self.current_player)
+    
+    def invalidate(self):
+        """
+        Forget the cached territory, influence and potential territory maps.
+        The caches are also dropped automatically whenever the board's version
+        changes, including moves made on the board directly.
+        """
+        self._territory_cache = None
+        self._influence_cache = None
+        self._potential_cache = None
+        self._cache_version = self.board.version
+    
+    def _check_cache_version(self):
+        """Drop the cached maps if the board has changed since they were computed."""
+        if self._cache_version != self.board.version:
+            self.invalidate()
+    
     def pass_turn(self):
         """
         Pass the current player's turn.
@@ -66,10 +308,11 @@ class GameState:
             bool: True if the game is over (two consecutive passes), False otherwise
         """
         self.pass_count += 1
-        self.move_history.append(("pass", self.current_player))
+        self._record_move(PASS, PASS, self.current_player)
+        self.invalidate()
         
         # Switch player
-        self.current_player = WHITE if self.current_player == BLACK else BLACK
+        self.current_player = _OPPONENT[self.current_player]
         
         # Check if the game is over (two consecutive passes)
         return self.pass_count >= 2
@@ -90,18 +333,7 @@ class GameState:
         Returns:
             dict: Dictionary with the count of stones for each color
         """
-        black_count = 0
-        white_count = 0
-        
-        for y in range(self.board.size):
-            for x in range(self.board.size):
-                stone = self.board.get_stone(x, y)
-                if stone == BLACK:
-                    black_count += 1
-                elif stone == WHITE:
-                    white_count += 1
-        
-        return {BLACK: black_count, WHITE: white_count}
+        return dict(self.board.stone_counts)
     
     def calculate_score(self):
         """
@@ -111,8 +343,10 @@ class GameState:
         Returns:
             dict: Dictionary with the score for each player
         """
+        # Both lookups are O(1) once the territory of the position is cached:
+        # the board keeps its stone counts up to date move by move
         territory = self.calculate_territory()
-        stones = self.count_stones()
+        stones = self.board.stone_counts
         
         black_score = stones[BLACK] + territory[BLACK]
         white_score = stones[WHITE] + territory[WHITE]
@@ -129,64 +363,138 @@ class GameState:
         Uses a more advanced algorithm inspired by KataGo's territory evaluation.
         
         Returns:
-            dict: Dictionary with the territory for each player and territory map
-        """
-        # Create a copy of the board to mark territory
-        territory_board = self.board.board.copy()
-        territory_map = np.zeros((self.board.size, self.board.size), dtype=int)
-        
-        # Find empty spaces and determine which player controls them
-        black_territory = 0
-        white_territory = 0
-        
-        # First, identify all empty regions using flood fill
-        visited = set()
-        empty_regions = []
-        
-        for y in range(self.board.size):
-            for x in range(self.board.size):
-                if territory_board[y, x] == EMPTY and (x, y) not in visited:
-                    # Found a new empty region, flood fill to find all connected empty points
-                    region = []
-                    border_colors = set()
-                    
-                    def flood_fill(cx, cy):
-                        if (cx, cy) in visited:
-                            return
-                        
-                        if not (0 <= cx < self.board.size and 0 <= cy < self.board.size):
-                            return
-                        
-                        if territory_board[cy, cx] == EMPTY:
-                            visited.add((cx, cy))
-                            region.append((cx, cy))
-                            flood_fill(cx+1, cy)
-                            flood_fill(cx-1, cy)
-                            flood_fill(cx, cy+1)
-                            flood_fill(cx, cy-1)
-                        elif territory_board[cy, cx] != EMPTY:
-                            # Found a border stone
-                            border_colors.add(territory_board[cy, cx])
-                    
-                    flood_fill(x, y)
-                    empty_regions.append((region, border_colors))
-        
-        # Assign territory based on the border colors of each empty region
-        for region, border_colors in empty_regions:
-            if len(border_colors) == 1:  # Region is surrounded by stones of one color
-                color = list(border_colors)[0]
-                for x, y in region:
-                    territory_map[y, x] = color  # Mark as territory
-                    if color == BLACK:
-                        black_territory += 1
-                    elif color == WHITE:
-                        white_territory += 1
-        
-        return {
-            BLACK: black_territory, 
-            WHITE: white_territory,
+            dict: Dictionary with the territory for each player and territory map.
+                  The result is cached until the next move, so the map is read-only.
+        """
+        self._check_cache_version()
+        if self._territory_cache is not None:
+            return self._territory_cache
+        
+        if NUMBA_AVAILABLE:
+            territory_map = self._label_territory()
+        elif SCIPY_AVAILABLE:
+            territory_map = self._scipy_label_territory()
+        else:
+            territory_map = self._flood_fill_territory()
+        territory_map.flags.writeable = False
+        
+        self._territory_cache = {
+            BLACK: np.count_nonzero(territory_map == BLACK), 
+            WHITE: np.count_nonzero(territory_map == WHITE),
             'territory_map': territory_map
         }
+        return self._territory_cache
+    
+    def _label_territory(self):
+        """
+        Build the territory map from the compiled empty-region labelling.
+        
+        Returns:
+            numpy.ndarray: Territory map with the owning color of each empty point, EMPTY elsewhere
+        """
+        width = self.board.size + 2
+        labels, borders = label_empty_regions(self.board.flat_board, width)
+        
+        # A region is territory only if a single color borders it. The extra
+        # trailing EMPTY owner is picked up by the -1 label of stones.
+        owners = np.append(np.where(borders == BLACK | WHITE, EMPTY, borders), EMPTY)
+        labels = labels.reshape(width, width)[1:-1, 1:-1]
+        return owners[labels].astype(int)
+    
+    def _scipy_label_territory(self):
+        """
+        Build the territory map from SciPy's connected-component labelling.
+        
+        Returns:
+            numpy.ndarray: Territory map with the owning color of each empty point, EMPTY elsewhere
+        """
+        padded = self.board.padded_board
+        empty = padded[1:-1, 1:-1] == EMPTY
+        labels, n_regions = ndimage.label(empty, structure=_CROSS)
+        
+        # OR together the colors of the four neighbors of every point in one
+        # pass for both colors; BLACK and WHITE are distinct bits, and the
+        # OFF_BOARD border is cleared so it adds neither
+        stones = np.where(padded == OFF_BOARD, EMPTY, padded)
+        near = stones[:-2, 1:-1] | stones[2:, 1:-1] | stones[1:-1, :-2] | stones[1:-1, 2:]
+        
+        # Count, for every region at once, its empty points next to each color
+        border_counts = {}
+        for color in (BLACK, WHITE):
+            border_counts[color] = np.bincount(labels[((near & color) != 0) & empty],
+                                               minlength=n_regions + 1)
+        
+        # A region bordered by a single color is that color's territory;
+        # label 0 is the stones and stays unowned
+        black_only = (border_counts[BLACK] > 0) & (border_counts[WHITE] == 0)
+        white_only = (border_counts[WHITE] > 0) & (border_counts[BLACK] == 0)
+        owners = np.where(black_only, BLACK, np.where(white_only, WHITE, EMPTY))
+        owners[0] = EMPTY
+        return owners[labels]
+    
+    def _flood_fill_territory(self):
+        """
+        Build the territory map by flood-filling the empty regions in Python.
+        
+        Returns:
+            numpy.ndarray: Territory map with the owning color of each empty point, EMPTY elsewhere
+        """
+        # Work on flat padded indices: a plain list reads faster than numpy
+        # scalars, and the precomputed neighbor table needs no bounds checks
+        flat = self.board.flat_board.tolist()
+        neighbors = self.board.neighbor_indices
+        
+        # Each point keeps only the integer label of its region, -1 for stones
+        # and the border, instead of per-region lists of points
+        labels = [-1] * len(flat)
+        owners = []
+        
+        for start, stone in enumerate(flat):
+            if stone != EMPTY or labels[start] != -1:
+                continue
+            
+            # Found a new empty region, flood fill to find all connected empty points.
+            # An explicit stack avoids deep recursion on large open regions.
+            label = len(owners)
+            border = 0
+            labels[start] = label
+            stack = [start]
+            
+            while stack:
+                current = stack.pop()
+                
+                for neighbor in neighbors[current]:
+                    stone = flat[neighbor]
+                    if stone == EMPTY:
+                        if labels[neighbor] == -1:
+                            labels[neighbor] = label
+                            stack.append(neighbor)
+                    else:
+                        # Found a border stone; BLACK | WHITE means both colors
+                        border |= stone
+                
+                if border == BLACK | WHITE:
+                    break
+            
+            # Both colors touch the region, so it is neutral: finish labelling
+            # it without looking at the border stones any more
+            while stack:
+                current = stack.pop()
+                
+                for neighbor in neighbors[current]:
+                    if flat[neighbor] == EMPTY and labels[neighbor] == -1:
+                        labels[neighbor] = label
+                        stack.append(neighbor)
+            
+            # A region surrounded by stones of one color is its territory
+            owners.append(EMPTY if border == BLACK | WHITE else border)
+        
+        # Map every point to its region's owner in one lookup; the trailing
+        # EMPTY owner is picked up by the -1 label of stones
+        owners.append(EMPTY)
+        width = self.board.size + 2
+        territory = np.array(owners)[np.array(labels)]
+        return territory.reshape(width, width)[1:-1, 1:-1]
     
     def calculate_influence(self):
         """
@@ -195,91 +503,50 @@ class GameState:
         
         Returns:
             numpy.ndarray: Influence map where positive values indicate black influence
-                          and negative values indicate white influence
+                          and negative values indicate white influence. The map is cached
+                          until the next move, so it is read-only.
         """
-        influence = np.zeros((self.board.size, self.board.size), dtype=float)
-        
-        # Constants for influence calculation
-        DIRECT_INFLUENCE = 1.5
-        DIAGONAL_INFLUENCE = 0.7
-        DECAY_FACTOR = 0.8
-        MAX_DISTANCE = 6
-        
-        # Calculate direct stone influence
-        for y in range(self.board.size):
-            for x in range(self.board.size):
-                stone = self.board.get_stone(x, y)
-                if stone == BLACK:
-                    influence[y, x] = DIRECT_INFLUENCE
-                elif stone == WHITE:
-                    influence[y, x] = -DIRECT_INFLUENCE
+        self._check_cache_version()
+        if self._influence_cache is not None:
+            return self._influence_cache
+        
+        board = self.board.board
+        # Stone masks are taken once and reused by every step below
+        black = board == BLACK
+        white = board == WHITE
+        empty = board == EMPTY
+        
+        # Calculate direct stone influence in one pass. The direct influence
+        # never leaves this method, so it is written into a reused buffer.
+        influence = self._direct_influence
+        np.subtract(black, white, out=influence, dtype=_INFLUENCE_DTYPE)
+        influence *= _DIRECT_INFLUENCE
         
         # Propagate influence
         influence_propagated = influence.copy()
         
-        for distance in range(1, MAX_DISTANCE + 1):
-            factor = DIRECT_INFLUENCE * (DECAY_FACTOR ** distance)
-            
-            for y in range(self.board.size):
-                for x in range(self.board.size):
-                    if self.board.get_stone(x, y) != EMPTY:
-                        continue  # Skip non-empty points
-                    
-                    # Check surrounding points at current distance
-                    total_influence = 0
-                    count = 0
-                    
-                    # Check in all directions (orthogonal and diagonal)
-                    for dy in range(-distance, distance + 1):
-                        for dx in range(-distance, distance + 1):
-                            # Consider both Manhattan and diagonal distances
-                            manhattan_dist = abs(dx) + abs(dy)
-                            diagonal_dist = max(abs(dx), abs(dy))
-                            
-                            # Only consider points at the current distance
-                            if manhattan_dist != distance and diagonal_dist != distance:
-                                continue
-                            
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.board.size and 0 <= ny < self.board.size:
-                                # Apply different weights for orthogonal vs diagonal connections
-                                if dx == 0 or dy == 0:  # Orthogonal
-                                    total_influence += influence[ny, nx]
-                                    count += 1
-                                else:  # Diagonal
-                                    total_influence += influence[ny, nx] * DIAGONAL_INFLUENCE / DIRECT_INFLUENCE
-                                    count += DIAGONAL_INFLUENCE / DIRECT_INFLUENCE
-                    
-                    if count > 0:
-                        influence_propagated[y, x] += (total_influence / count) * factor
+        # Each distance adds the weighted mean of the direct influence on a ring
+        # around every empty point: the orthogonal and diagonal points at that
+        # Manhattan or Chebyshev distance. Both the weighted sum and the total
+        # weight of the on-board ring points are correlations with the ring kernel;
+        # the totals only depend on the board size, so they are precomputed with
+        # the decay into one scale map per ring.
+        # Every step works in place in one scratch buffer.
+        ring_sum = self._ring_sum
+        for kernel, scale in _influence_rings(self.board.size):
+            _correlate(influence, kernel, ring_sum)
+            ring_sum *= scale
+            np.add(influence_propagated, ring_sum, out=influence_propagated, where=empty)
         
         # Apply group-based influence boost
-        # Stones in groups have more influence than isolated stones
-        for y in range(self.board.size):
-            for x in range(self.board.size):
-                if self.board.get_stone(x, y) == EMPTY:
-                    # Check if this empty point is near a group of stones
-                    black_group_size = 0
-                    white_group_size = 0
-                    
-                    # Check in a small radius
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.board.size and 0 <= ny < self.board.size:
-                                stone = self.board.get_stone(nx, ny)
-                                if stone == BLACK:
-                                    black_group_size += 1
-                                elif stone == WHITE:
-                                    white_group_size += 1
-                    
-                    # Boost influence based on group size
-                    group_factor = 0.2
-                    if black_group_size > white_group_size:
-                        influence_propagated[y, x] += (black_group_size - white_group_size) * group_factor
-                    elif white_group_size > black_group_size:
-                        influence_propagated[y, x] -= (white_group_size - black_group_size) * group_factor
-        
+        # Stones in groups have more influence than isolated stones: each empty
+        # point gains the black minus white stone count of the 5x5 area around it,
+        # scaled by _GROUP_FACTOR through the pre-scaled kernel
+        _correlate(influence, _GROUP_KERNEL, ring_sum)
+        np.add(influence_propagated, ring_sum, out=influence_propagated, where=empty)
+        
+        influence_propagated.flags.writeable = False
+        self._influence_cache = influence_propagated
         return influence_propagated
     
     def get_potential_territory(self):
@@ -287,31 +554,33 @@ class GameState:
         Get potential territory based on influence and current territory.
         
         Returns:
-            dict: Dictionary with potential territory information
+            dict: Dictionary with potential territory information. The result is cached
+                  until the next move, so its maps are read-only.
         """
+        # The UI asks for this every frame; reuse it until the board changes
+        self._check_cache_version()
+        if self._potential_cache is not None:
+            return self._potential_cache
+        
         territory = self.calculate_territory()
         influence = self.calculate_influence()
         
-        # Create potential territory map
-        potential_territory = np.zeros((self.board.size, self.board.size), dtype=int)
-        
-        # First, copy definite territory
+        # Create potential territory map, starting from a copy of definite territory
         potential_territory = territory['territory_map'].copy()
         
         # Then, mark potential territory based on influence
-        for y in range(self.board.size):
-            for x in range(self.board.size):
-                if potential_territory[y, x] == EMPTY:
-                    if influence[y, x] > 0.2:
-                        potential_territory[y, x] = 3
-                    elif influence[y, x] < -0.2:
-                        potential_territory[y, x] = 4
+        unclaimed = potential_territory == EMPTY
+        black_potential_mask = unclaimed & (influence > 0.2)
+        white_potential_mask = unclaimed & (influence < -0.2)
+        potential_territory[black_potential_mask] = 3
+        potential_territory[white_potential_mask] = 4
         
         # Count potential territory
-        black_potential = np.sum(potential_territory == 3)
-        white_potential = np.sum(potential_territory == 4)
+        black_potential = np.count_nonzero(black_potential_mask)
+        white_potential = np.count_nonzero(white_potential_mask)
+        potential_territory.flags.writeable = False
         
-        return {
+        self._potential_cache = {
             'territory_map': territory['territory_map'],
             'potential_territory_map': potential_territory,
             'influence': influence,
@@ -320,6 +589,7 @@ class GameState:
             'black_potential': black_potential,
             'white_potential': white_potential
         }
+        return self._potential_cache
     
     def check_surrounded_by(self, x, y):
         """
@@ -335,24 +605,20 @@ class GameState:
         """
         # This is a simplified version that just checks immediate neighbors
         # A more accurate version would use flood fill to find connected empty spaces
-        black_count = 0
-        white_count = 0
+        flat = self.board.flat_board
+        point = (y + 1) * (self.board.size + 2) + x + 1
         
-        for nx, ny in [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]:
-            if 0 <= nx < self.board.size and 0 <= ny < self.board.size:
-                stone = self.board.get_stone(nx, ny)
-                if stone == BLACK:
-                    black_count += 1
-                elif stone == WHITE:
-                    white_count += 1
+        # OR the neighbor colors into one bitmask; BLACK and WHITE are distinct
+        # bits and EMPTY adds nothing. Precomputed on-board neighbors need no
+        # bounds checks.
+        border = 0
+        for neighbor in self.board.neighbor_indices[point]:
+            border |= int(flat[neighbor])
         
         # If all neighbors are of one color, it's territory of that color
-        if black_count > 0 and white_count == 0:
-            return BLACK
-        elif white_count > 0 and black_count == 0:
-            return WHITE
-        else:
+        if border == BLACK | WHITE:
             return EMPTY
+        return border
     
     def current_player_name(self):
         """
@@ -361,4 +627,4 @@ class GameState:
         Returns:
             str: "Black" or "White"
         """
-        return "Black" if self.current_player == BLACK else "White"
+        return _NAME[self.current_player]
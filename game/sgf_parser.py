@@ -4,8 +4,89 @@ Handles loading and parsing SGF files for Go games.
 """
 
 import re
+import numpy as np
 from .constants import BLACK, WHITE, EMPTY, BOARD_SIZE
 
+# Use Google's RE2 engine when it is installed: it matches in linear time with
+# a DFA. The patterns below stay within the syntax both engines support.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Patterns are compiled once. A property value is a run of characters other
+# than ] and backslash, or of backslash escapes, so an escaped \] does not end
+# the value; the two alternatives never overlap, so each value is matched in
+# one linear pass without backtracking. Values are kept with their escapes.
+# Content is not whitespace-normalized, so the patterns allow line breaks.
+_VALUE = r'(?:[^\]\\]|\\[\s\S])*'
+_WS_RE = _regex.compile(r'\s+')
+_GAME_TREE_RE = _regex.compile(r'(?s)\(\s*;(.*)\)')
+_PROP_RE = _regex.compile(r'([A-Z]+)\s*((?:\[' + _VALUE + r'\]\s*)+)')
+_VAL_RE = _regex.compile(r'\[(' + _VALUE + r')\]')
+# A property identifier with its first value. Matching the whole identifier
+# tells the B and W moves apart from PB, AB, PW, AW and the like.
+_NODE_PROP_RE = _regex.compile(r'([A-Z]+)\[(' + _VALUE + r')\]')
+_MOVE_COLORS = ('B', 'W')
+
+def _strip_comments(content):
+    """
+    Remove comment (C) properties from SGF content in a single pass.
+    
+    Jumps from one property value to the next with str.find, honoring
+    escaped brackets inside values, and keeps everything that is not
+    part of a C property.
+    
+    Args:
+        content (str): SGF content
+    
+    Returns:
+        str: SGF content without comments
+    """
+    kept = []
+    keep_from = 0  # Start of the span still to be kept
+    property_name = ''  # Identifier of the property the current value belongs to
+    value_end = 0  # Index just past the previous value
+    
+    while True:
+        start = content.find('[', value_end)
+        if start == -1:
+            break
+        
+        # The identifier is the run of letters before the bracket; a value with
+        # only whitespace since the previous one continues that property
+        name_end = start
+        while name_end > value_end and content[name_end - 1].isspace():
+            name_end -= 1
+        name_start = name_end
+        while name_start > value_end and content[name_start - 1].isalpha():
+            name_start -= 1
+        if name_start < name_end:
+            property_name = content[name_start:name_end]
+        elif name_end > value_end:
+            property_name = ''
+        
+        # Find the closing bracket, skipping brackets escaped with a backslash
+        end = content.find(']', start + 1)
+        while end != -1:
+            backslashes = 0
+            while content[end - 1 - backslashes] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                break
+            end = content.find(']', end + 1)
+        value_end = len(content) if end == -1 else end + 1
+        
+        if property_name == 'C':
+            if name_start < name_end:
+                kept.append(content[keep_from:name_start])
+            else:
+                kept.append(content[keep_from:start])
+            keep_from = value_end
+    
+    kept.append(content[keep_from:])
+    return ''.join(kept)
+
 class SGFParser:
     """
     Parser for SGF (Smart Game Format) files, commonly used for Go game records.
@@ -29,21 +110,24 @@ class SGFParser:
             dict: Parsed game information
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.sgf_content = f.read()
-            return self.parse_content(self.sgf_content)
-        except UnicodeDecodeError:
-            # Try with different encodings if UTF-8 fails
-            try:
-                with open(file_path, 'r', encoding='iso-8859-1') as f:
-                    self.sgf_content = f.read()
-                return self.parse_content(self.sgf_content)
-            except Exception as e:
-                print(f"Error parsing SGF file: {e}")
-                return None
+            with open(file_path, 'rb') as f:
+                data = f.read()
         except Exception as e:
             print(f"Error opening SGF file: {e}")
             return None
+        
+        # Decode the bytes already read instead of reopening the file;
+        # iso-8859-1 maps every byte, so the fallback cannot fail
+        try:
+            self.sgf_content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            self.sgf_content = data.decode('iso-8859-1')
+        
+        try:
+            return self.parse_content(self.sgf_content)
+        except Exception as e:
+            print(f"Error parsing SGF file: {e}")
+            return None
     
     def parse_content(self, content):
         """
@@ -59,12 +143,11 @@ class SGFParser:
         self.properties = {}
         self.moves = []
         
-        # Remove comments and whitespace
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'C\[.*?\]', '', content)
+        # Remove comments
+        content = _strip_comments(content)
         
         # Extract the main game tree
-        match = re.search(r'\(;(.*)\)', content)
+        match = _GAME_TREE_RE.search(content)
         if not match:
             print("Invalid SGF format: No game tree found")
             return None
@@ -96,9 +179,7 @@ class SGFParser:
         Args:
             game_tree (str): SGF game tree content
         """
-        # Find all property value pairs (e.g., SZ[19])
-        property_pattern = r'([A-Z]+)(\[.*?\])'
-        
+        # Find all property value pairs (e.g., SZ[19] or AB[aa][bb])
         # Extract initial properties (before the first move)
         first_move_index = game_tree.find(';', 1)
         if first_move_index == -1:
@@ -106,12 +187,12 @@ class SGFParser:
         else:
             header = game_tree[:first_move_index]
         
-        for match in re.finditer(property_pattern, header):
+        for match in _PROP_RE.finditer(header):
             prop_name = match.group(1)
             prop_value = match.group(2)
             
             # Extract the value from brackets
-            values = re.findall(r'\[(.*?)\]', prop_value)
+            values = [_WS_RE.sub(' ', value) for value in _VAL_RE.findall(prop_value)]
             
             if prop_name not in self.properties:
                 self.properties[prop_name] = values
@@ -125,48 +206,28 @@ class SGFParser:
         Args:
             game_tree (str): SGF game tree content
         """
-        # Find all move nodes (starting with ;)
-        nodes = game_tree.split(';')
-        
-        # Skip the first node (it contains the header properties)
-        for node in nodes[1:]:
-            # Look for B or W moves
-            b_move = re.search(r'B\[(.*?)\]', node)
-            w_move = re.search(r'W\[(.*?)\]', node)
-            
-            if b_move:
-                pos = b_move.group(1)
-                if pos:  # Not a pass
-                    x, y = self._sgf_pos_to_coords(pos)
-                    self.moves.append(('B', x, y))
-                else:  # Pass
-                    self.moves.append(('B', None, None))
-            
-            if w_move:
-                pos = w_move.group(1)
-                if pos:  # Not a pass
-                    x, y = self._sgf_pos_to_coords(pos)
-                    self.moves.append(('W', x, y))
-                else:  # Pass
-                    self.moves.append(('W', None, None))
-    
-    def _sgf_pos_to_coords(self, pos):
-        """
-        Convert SGF position (e.g., 'aa', 'cd') to board coordinates.
-        
-        Args:
-            pos (str): SGF position
-            
-        Returns:
-            tuple: (x, y) coordinates
-        """
-        if len(pos) < 2:
-            return None, None
-        
-        x = ord(pos[0]) - ord('a')
-        y = ord(pos[1]) - ord('a')
-        
-        return x, y
+        # Move nodes follow the header node
+        first_move_index = game_tree.find(';')
+        if first_move_index == -1:
+            return
+        
+        # One pass over all nodes picks up every B[..] and W[..] move in order
+        moves = [(name, pos) for name, pos in _NODE_PROP_RE.findall(game_tree, first_move_index)
+                 if name in _MOVE_COLORS]
+        
+        # Convert all positions at once: the first two characters of each
+        # position are encoded as fixed-width code points and offset from 'a'.
+        # Passes and malformed positions shorter than two characters have no coordinates.
+        positions = ''.join(pos[:2] for _, pos in moves if len(pos) >= 2)
+        codes = np.frombuffer(positions.encode('utf-32-le'), dtype=np.uint32)
+        coords = iter((codes.astype(np.int64) - ord('a')).reshape(-1, 2).tolist())
+        
+        for color, pos in moves:
+            if len(pos) >= 2:
+                x, y = next(coords)
+                self.moves.append((color, x, y))
+            else:  # Pass
+                self.moves.append((color, None, None))
     
     def get_game_info(self):
         """
@@ -6,11 +6,12 @@ A PyGame-based implementation of the Go board game with basic game mechanics.
 
 import pygame
 import sys
+import logging
 import numpy as np
 import os
 from game.board import Board
 from game.constants import (
-    BLACK, WHITE, EMPTY, BOARD_SIZE, CELL_SIZE, BOARD_PADDING,
+    BLACK, WHITE, EMPTY, BOARD_SIZE, CELL_SIZE, BOARD_PADDING, FPS,
     BLACK_TERRITORY, WHITE_TERRITORY, POTENTIAL_BLACK_TERRITORY, POTENTIAL_WHITE_TERRITORY,
     BLACK_TERRITORY_COLOR, WHITE_TERRITORY_COLOR, 
     POTENTIAL_BLACK_TERRITORY_COLOR, POTENTIAL_WHITE_TERRITORY_COLOR,
@@ -18,8 +19,60 @@ from game.constants import (
     TERRITORY_MARKER_SHAPE
 )
 from game.game_state import GameState
+from game._accelerated import NUMBA_AVAILABLE, influence_squares
 from game.sgf_parser import SGFParser
 
+# Rendered territory markers, keyed by (shape, size, color)
+_MARKER_CACHE = {}
+
+def get_marker_surface(shape, size, color):
+    """
+    Get the rendered surface of a territory marker, creating it on first use.
+    
+    Args:
+        shape (str): "circle", "square" or "diamond"
+        size (int): Size of the marker
+        color (tuple): Color of the marker (RGBA)
+    
+    Returns:
+        pygame.Surface: Surface in the display format, or None for an unknown shape.
+                        Opaque colors use a color key instead of per-pixel alpha.
+    """
+    key = (shape, size, color)
+    if key not in _MARKER_CACHE:
+        opaque = len(color) == 3 or color[3] == 255
+        if opaque:
+            # Fully opaque markers only need their background keyed out, so
+            # blitting them is a plain copy rather than a per-pixel blend
+            s = pygame.Surface((size, size))
+            background = (0, 0, 0) if tuple(color[:3]) != (0, 0, 0) else (255, 255, 255)
+            s.fill(background)
+            s.set_colorkey(background)
+        else:
+            # Create a surface with per-pixel alpha
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+        
+        if shape == "circle":
+            pygame.draw.circle(s, color, (size // 2, size // 2), size // 2)
+        elif shape == "square":
+            pygame.draw.rect(s, color, (0, 0, size, size))
+        elif shape == "diamond":
+            points = [
+                (size // 2, 0),
+                (size, size // 2),
+                (size // 2, size),
+                (0, size // 2)
+            ]
+            pygame.draw.polygon(s, color, points)
+        else:
+            s = None
+        
+        # Converted once so every blit takes the display-format path
+        if s is not None:
+            s = s.convert() if opaque else s.convert_alpha()
+        _MARKER_CACHE[key] = s
+    return _MARKER_CACHE[key]
+
 def draw_territory_marker(screen, x, y, size, color):
     """
     Draw a territory marker at the specified position.
@@ -30,68 +83,137 @@ def draw_territory_marker(screen, x, y, size, color):
         size: Size of the marker
         color: Color of the marker (RGBA)
     """
-    if TERRITORY_MARKER_SHAPE == "circle":
-        # Create a surface with per-pixel alpha
-        s = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(s, color, (size // 2, size // 2), size // 2)
-        screen.blit(s, (x - size // 2, y - size // 2))
-    elif TERRITORY_MARKER_SHAPE == "square":
-        # Create a surface with per-pixel alpha
-        s = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.rect(s, color, (0, 0, size, size))
-        screen.blit(s, (x - size // 2, y - size // 2))
-    elif TERRITORY_MARKER_SHAPE == "diamond":
-        # Create a surface with per-pixel alpha
-        s = pygame.Surface((size, size), pygame.SRCALPHA)
-        points = [
-            (size // 2, 0),
-            (size, size // 2),
-            (size // 2, size),
-            (0, size // 2)
-        ]
-        pygame.draw.polygon(s, color, points)
-        screen.blit(s, (x - size // 2, y - size // 2))
+    # An opaque square needs no surface at all
+    if TERRITORY_MARKER_SHAPE == "square" and (len(color) == 3 or color[3] == 255):
+        pygame.draw.rect(screen, color, (x - size // 2, y - size // 2, size, size))
+        return
+    
+    marker = get_marker_surface(TERRITORY_MARKER_SHAPE, size, color)
+    if marker is not None:
+        screen.blit(marker, (x - size // 2, y - size // 2))
 
-def draw_statistics_button(screen, button, show_influence):
-    """Draw the statistics button with appropriate colors based on state"""
-    if show_influence:
-        pygame.draw.rect(screen, (100, 100, 200), button)  # Highlighted when active
-    else:
-        pygame.draw.rect(screen, (200, 200, 200), button)  # Gray when inactive
+def get_influence_squares(influence_map, board_array, x_offset, y_offset):
+    """
+    Compute the influence totals and the squares that show influence on the board.
+    
+    Each empty point with an influence of at least 0.1 in magnitude gets a
+    square centered on it, sized and made opaque in proportion to its
+    influence, normalized by the largest magnitude on the board (at least 1).
+    
+    Args:
+        influence_map (numpy.ndarray): float32 influence map, positive for black
+        board_array (numpy.ndarray): Board array without padding
+        x_offset (int): x coordinate of the first column on the target surface
+        y_offset (int): y coordinate of the first row on the target surface
+    
+    Returns:
+        tuple: (float total black influence, float total white influence,
+                int32 array with one (left, top, size, alpha, shade) row per square,
+                the shade being 0 for black squares and 255 for white ones)
+    """
+    if NUMBA_AVAILABLE:
+        # Totals and squares in one compiled pass over the map
+        return influence_squares(influence_map, board_array, CELL_SIZE, x_offset, y_offset)
+    
+    # Normalize the influence by its largest magnitude, at least 1
+    magnitude = np.abs(influence_map)
+    max_influence = max(1.0, float(magnitude.max()))
+    
+    # Calculate total influence for each player; white influence is negative
+    black_total = float(influence_map.sum(where=influence_map > 0, dtype=np.float64))
+    white_total = -float(influence_map.sum(where=influence_map < 0, dtype=np.float64))
+    
+    # Squares go on the empty points with a visible influence; the geometry
+    # of every square is computed at once from the normalized map
+    ys, xs = np.nonzero((board_array == EMPTY) & (magnitude >= 0.1))
+    strength = magnitude[ys, xs] / max_influence
+    
+    # Scale the influence to a size between the minimum and maximum factors
+    base_size_factor = 0.3  # Minimum size factor (for very small influence)
+    max_size_factor = 0.9   # Maximum size factor (for maximum influence)
+    size_factor = base_size_factor + (max_size_factor - base_size_factor) * np.minimum(1.0, strength)
+    
+    # Pixel size of each square, with a minimum size for visibility
+    rect_sizes = np.maximum((CELL_SIZE * size_factor).astype(np.int32), 8)
+    alphas = np.minimum(255, 100 + 155 * strength).astype(np.int32)
+    lefts = x_offset + xs * CELL_SIZE - rect_sizes // 2
+    tops = y_offset + ys * CELL_SIZE - rect_sizes // 2
+    shades = 255 * (influence_map[ys, xs] < 0)  # Black squares for positive influence, white for negative
+    squares = np.column_stack((lefts, tops, rect_sizes, alphas, shades)).astype(np.int32)
+    return black_total, white_total, squares
+
+# Per-click and per-move tracing is logged at DEBUG level, so it costs
+# nothing unless logging is configured to show it
+logger = logging.getLogger(__name__)
+
+# The only event types the game and the file dialog act on
+INPUT_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
+# Events that make the game loop redraw the board: input, plus the window
+# being uncovered, since frames without input are not drawn
+REDRAW_EVENTS = INPUT_EVENTS + (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+# Loaded fonts, keyed by (system font name or None for the default font, size)
+_FONT_CACHE = {}
+
+def get_font(name, size):
+    """
+    Get a font, loading it on first use.
+    
+    Args:
+        name (str): System font name, or None for pygame's default font
+        size (int): Font size
+    
+    Returns:
+        pygame.font.Font: The shared font object
+    """
+    key = (name, size)
+    if key not in _FONT_CACHE:
+        _FONT_CACHE[key] = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+    return _FONT_CACHE[key]
+
+# Rendered button surfaces, keyed by (label, fill color, size)
+_BUTTON_CACHE = {}
+
+def get_button_surface(label, fill_color, size):
+    """
+    Get the rendered surface of a button, creating it on first use.
     
-    pygame.draw.rect(screen, (0, 0, 0), button, 2)  # Black border
+    Args:
+        label (str): Button text
+        fill_color (tuple): RGB background color
+        size (tuple): (width, height) of the button
     
-    # Draw button text
-    font = pygame.font.Font(None, 24)
-    text = font.render("Statistics", True, (0, 0, 0))
-    text_rect = text.get_rect(center=button.center)
-    screen.blit(text, text_rect)
+    Returns:
+        pygame.Surface: Button with its background, black border and centered text
+    """
+    key = (label, fill_color, size)
+    if key not in _BUTTON_CACHE:
+        surface = pygame.Surface(size).convert()
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, fill_color, rect)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 2)  # Black border
+        
+        text = get_font(None, 24).render(label, True, (0, 0, 0))
+        surface.blit(text, text.get_rect(center=rect.center))
+        _BUTTON_CACHE[key] = surface
+    return _BUTTON_CACHE[key]
+
+def draw_statistics_button(screen, button, show_influence):
+    """Draw the statistics button with appropriate colors based on state"""
+    # Highlighted when active, gray when inactive
+    fill_color = (100, 100, 200) if show_influence else (200, 200, 200)
+    screen.blit(get_button_surface("Statistics", fill_color, button.size), button.topleft)
 
 def draw_load_game_button(screen, button):
     """Draw the load game button"""
-    pygame.draw.rect(screen, (200, 200, 200), button)  # Gray background
-    pygame.draw.rect(screen, (0, 0, 0), button, 2)  # Black border
-    
-    # Draw button text
-    font = pygame.font.Font(None, 24)
-    text = font.render("Load game", True, (0, 0, 0))
-    text_rect = text.get_rect(center=button.center)
-    screen.blit(text, text_rect)
+    screen.blit(get_button_surface("Load game", (200, 200, 200), button.size), button.topleft)
 
 def draw_move_numbers_button(screen, button, show_move_numbers):
     """Draw the move numbers button with appropriate colors based on state"""
-    if show_move_numbers:
-        pygame.draw.rect(screen, (100, 200, 100), button)  # Highlighted when active
-    else:
-        pygame.draw.rect(screen, (200, 200, 200), button)  # Gray when inactive
-    
-    pygame.draw.rect(screen, (0, 0, 0), button, 2)  # Black border
-    
-    # Draw button text
-    font = pygame.font.Font(None, 24)
-    text = font.render("Move Numbers", True, (0, 0, 0))
-    text_rect = text.get_rect(center=button.center)
-    screen.blit(text, text_rect)
+    # Highlighted when active, gray when inactive
+    fill_color = (100, 200, 100) if show_move_numbers else (200, 200, 200)
+    screen.blit(get_button_surface("Move Numbers", fill_color, button.size), button.topleft)
 
 class SimpleFileDialog:
     """A simple file dialog implementation using pygame"""
@@ -108,8 +230,8 @@ class SimpleFileDialog:
             self.current_dir = start_dir
             
         # UI settings
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 32)
+        self.font = get_font(None, 24)
+        self.title_font = get_font(None, 32)
         self.bg_color = (240, 240, 240)
         self.text_color = (0, 0, 0)
         self.highlight_color = (200, 200, 255)
@@ -121,6 +243,13 @@ class SimpleFileDialog:
         self.scroll_offset = 0
         self.max_visible_items = 15
         
+        # Redraw state: the static background is rendered once, and each draw
+        # only pushes the parts of the screen that changed since the last one
+        self._background = None  # Fill, title and separator
+        self._drawn_state = None  # (directory, file count, selection, scroll) last drawn
+        self._dir_surface = None  # Rendered "Directory: ..." header
+        self._item_surfaces = []  # Rendered text of each file list entry, None until first drawn
+        
         # Get initial file list
         self.update_file_list()
     
@@ -132,23 +261,66 @@ class SimpleFileDialog:
         self.files.append(("..", True))
         
         try:
-            # Get all files and directories in the current directory
-            for item in os.listdir(self.current_dir):
-                full_path = os.path.join(self.current_dir, item)
-                is_dir = os.path.isdir(full_path)
-                
-                # Only include directories and files with the specified extension
-                if is_dir or (not is_dir and item.lower().endswith(self.file_extension)):
-                    self.files.append((item, is_dir))
+            # Get all files and directories in the current directory. scandir
+            # reports the entry type from the directory listing itself, so
+            # there is no stat call per entry except for symbolic links.
+            extension = self.file_extension.lower()
+            entries = []
+            with os.scandir(self.current_dir) as it:
+                for entry in it:
+                    is_dir = entry.is_dir()
+                    name = entry.name
+                    lower_name = name.lower()
+                    
+                    # Only include directories and files with the specified extension
+                    if is_dir or lower_name.endswith(extension):
+                        # Sort directories first, then files, by their decorated tuples
+                        entries.append((not is_dir, lower_name, name, is_dir))
             
-            # Sort directories first, then files
-            self.files.sort(key=lambda x: (not x[1], x[0].lower()))
+            entries.sort()
+            self.files.extend((name, is_dir) for _, _, name, is_dir in entries)
             
             # Reset selection and scroll
             self.selected_index = 0
             self.scroll_offset = 0
         except Exception as e:
             print(f"Error reading directory: {e}")
+        
+        # The rendered text only changes with the directory
+        self._dir_surface = None
+        self._item_surfaces = [None] * len(self.files)
+    
+    def _item_surface(self, index):
+        """Get the rendered text of a file list entry, rendering it on first use"""
+        if self._item_surfaces[index] is None:
+            item, is_dir = self.files[index]
+            if is_dir:
+                item_text = f"📁 {item}"
+            else:
+                item_text = f"📄 {item}"
+            self._item_surfaces[index] = self.font.render(item_text, True, self.text_color)
+        return self._item_surfaces[index]
+    
+    def _open_selected(self):
+        """
+        Open the selected entry: enter it if it is a directory, otherwise choose it.
+        
+        Returns:
+            str: Path of the selected file, or None if a directory was entered
+        """
+        item, is_dir = self.files[self.selected_index]
+        
+        if is_dir:
+            # Navigate to directory
+            if item == "..":
+                self.current_dir = os.path.dirname(self.current_dir)
+            else:
+                self.current_dir = os.path.join(self.current_dir, item)
+            self.update_file_list()
+            return None
+        
+        # Return the selected file path
+        return os.path.join(self.current_dir, item)
     
     def handle_event(self, event):
         """Handle pygame events for the file dialog"""
@@ -166,50 +338,29 @@ class SimpleFileDialog:
             elif event.key == pygame.K_RETURN:
                 # Handle selection
                 if self.selected_index < len(self.files):
-                    item, is_dir = self.files[self.selected_index]
-                    
-                    if is_dir:
-                        # Navigate to directory
-                        if item == "..":
-                            self.current_dir = os.path.dirname(self.current_dir)
-                        else:
-                            self.current_dir = os.path.join(self.current_dir, item)
-                        self.update_file_list()
-                        return None
-                    else:
-                        # Return the selected file path
-                        return os.path.join(self.current_dir, item)
+                    return self._open_selected()
             elif event.key == pygame.K_ESCAPE:
                 # Cancel selection
                 return False
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                # Calculate which item was clicked
-                mouse_y = event.pos[1]
+                # Calculate which item was clicked, relative to the dialog,
+                # which may be drawn on a part of the window
+                offset_x, offset_y = self.screen.get_abs_offset()
+                mouse_x = event.pos[0] - offset_x
+                mouse_y = event.pos[1] - offset_y
                 item_height = 30
                 header_height = 60
                 
                 # Check if click is in the file list area
-                if mouse_y > header_height:
+                if 0 <= mouse_x < self.screen.get_width() and header_height < mouse_y < self.screen.get_height():
                     clicked_index = self.scroll_offset + (mouse_y - header_height) // item_height
                     
                     if 0 <= clicked_index < len(self.files):
                         if clicked_index == self.selected_index:
                             # Double-click handling (simplified)
-                            item, is_dir = self.files[self.selected_index]
-                            
-                            if is_dir:
-                                # Navigate to directory
-                                if item == "..":
-                                    self.current_dir = os.path.dirname(self.current_dir)
-                                else:
-                                    self.current_dir = os.path.join(self.current_dir, item)
-                                self.update_file_list()
-                                return None
-                            else:
-                                # Return the selected file path
-                                return os.path.join(self.current_dir, item)
+                            return self._open_selected()
                         else:
                             # Single click - update selection
                             self.selected_index = clicked_index
@@ -224,31 +375,54 @@ class SimpleFileDialog:
         
         return None
     
-    def draw(self):
-        """Draw the file dialog"""
-        # Draw background
-        self.screen.fill(self.bg_color)
+    def _render_background(self):
+        """Render the parts of the dialog that never change"""
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill(self.bg_color)
         
         # Draw title
         title_surf = self.title_font.render(self.title, True, self.text_color)
-        self.screen.blit(title_surf, (20, 10))
-        
-        # Draw current directory
-        dir_surf = self.font.render(f"Directory: {self.current_dir}", True, self.text_color)
-        self.screen.blit(dir_surf, (20, 40))
+        background.blit(title_surf, (20, 10))
         
         # Draw separator line
-        pygame.draw.line(self.screen, self.border_color, (0, 60), (self.screen.get_width(), 60), 2)
+        pygame.draw.line(background, self.border_color, (0, 60), (background.get_width(), 60), 2)
+        return background
+    
+    def _row_rect(self, index):
+        """Get the screen rectangle of a file list entry"""
+        return pygame.Rect(0, 60 + (index - self.scroll_offset) * 30, self.screen.get_width(), 30)
+    
+    def draw(self):
+        """Draw the file dialog, updating only the parts of the display that changed"""
+        state = (self.current_dir, len(self.files), self.selected_index, self.scroll_offset)
+        if state == self._drawn_state:
+            return
+        
+        # A new selection on the same page only changes two rows; anything
+        # else (first draw, new directory, scrolling) repaints the whole dialog
+        if self._drawn_state is not None and self._drawn_state[:2] == state[:2] and self._drawn_state[3] == state[3]:
+            dirty_rects = [self._row_rect(self._drawn_state[2]), self._row_rect(self.selected_index)]
+        else:
+            dirty_rects = [self.screen.get_rect()]
+        self._drawn_state = state
+        
+        # Draw background
+        if self._background is None:
+            self._background = self._render_background()
+        self.screen.blit(self._background, (0, 0))
         
-        # Draw file list
+        # Draw current directory
+        if self._dir_surface is None:
+            self._dir_surface = self.font.render(f"Directory: {self.current_dir}", True, self.text_color)
+        self.screen.blit(self._dir_surface, (20, 40))
+        
+        # Draw file list, taking the entries that fit on the page as one slice
         item_height = 30
-        visible_range = range(
-            self.scroll_offset,
-            min(len(self.files), self.scroll_offset + self.max_visible_items)
-        )
+        first = self.scroll_offset
+        visible_surfaces = self._item_surfaces[first:first + self.max_visible_items]
         
-        for i, idx in enumerate(visible_range):
-            item, is_dir = self.files[idx]
+        for i, text_surf in enumerate(visible_surfaces):
+            idx = first + i
             y_pos = 60 + i * item_height
             
             # Highlight selected item
@@ -259,13 +433,9 @@ class SimpleFileDialog:
                     (0, y_pos, self.screen.get_width(), item_height)
                 )
             
-            # Draw item text
-            if is_dir:
-                item_text = f"📁 {item}"
-            else:
-                item_text = f"📄 {item}"
-            
-            text_surf = self.font.render(item_text, True, self.text_color)
+            # Draw item text, rendering it if this is its first time on screen
+            if text_surf is None:
+                text_surf = self._item_surface(idx)
             self.screen.blit(text_surf, (20, y_pos + 5))
         
         # Draw scrollbar if needed
@@ -296,22 +466,29 @@ class SimpleFileDialog:
             (20, self.screen.get_height() - 30)
         )
         
-        pygame.display.flip()
+        # The dialog may be a subsurface, so move its rects to window coordinates
+        offset = self.screen.get_abs_offset()
+        pygame.display.update([rect.move(offset) for rect in dirty_rects])
 
 def load_sgf_file(screen):
     """
     Open a file dialog to select an SGF file using the pygame-native approach
     Returns the file path if a file was selected, None otherwise
     """
-    # Store the original screen state
-    original_screen_copy = screen.copy()
-    
-    # Create a temporary screen for the file dialog
-    dialog_screen = pygame.display.set_mode((600, 500))
+    # Show the dialog as a panel over the dimmed game on the existing window,
+    # instead of recreating the window for it and again afterwards
+    dim = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    dim.fill((0, 0, 0, 128))
+    screen.blit(dim, (0, 0))
+    pygame.display.flip()
     pygame.display.set_caption("Select SGF File")
     
+    panel = pygame.Rect(0, 0, 600, 500)
+    panel.center = screen.get_rect().center
+    panel = panel.clip(screen.get_rect())
+    
     # Create and run the file dialog
-    file_dialog = SimpleFileDialog(dialog_screen, title="Select SGF File", file_extension=".sgf")
+    file_dialog = SimpleFileDialog(screen.subsurface(panel), title="Select SGF File", file_extension=".sgf")
     
     running = True
     selected_file = None
@@ -319,7 +496,13 @@ def load_sgf_file(screen):
     while running:
         file_dialog.draw()
         
-        for event in pygame.event.get():
+        # Sleep until the next input event (or a timeout) instead of polling.
+        # The queue is drained unfiltered: a type filter would return the events
+        # grouped by type rather than in arrival order, and main() already keeps
+        # other event types out of the queue
+        events = [pygame.event.wait(500)]
+        events.extend(pygame.event.get())
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 selected_file = None
@@ -328,14 +511,9 @@ def load_sgf_file(screen):
                 if result is not None:
                     running = False
                     selected_file = result if result is not False else None
-        
-        pygame.time.delay(10)  # Small delay to reduce CPU usage
     
-    # Restore the original screen
-    screen_size = original_screen_copy.get_size()
-    screen = pygame.display.set_mode(screen_size)
-    screen.blit(original_screen_copy, (0, 0))
-    pygame.display.flip()
+    # The game loop repaints the whole window on its next frame
+    pygame.display.set_caption("AlphaGo Implementation")
     
     return selected_file
 
@@ -390,7 +568,7 @@ def load_game_from_sgf(file_path, board, game_state):
         
         # Place the stone
         if not game_state.place_stone(x, y):
-            print(f"Warning: Invalid move in SGF file: {color} at ({x}, {y})")
+            logger.warning("Invalid move in SGF file: %s at (%d, %d)", color, x, y)
     
     # Set the current player to the next player after the last move
     if game_info['moves'] and game_info['moves'][-1][0] == 'B':
@@ -400,215 +578,14 @@ def load_game_from_sgf(file_path, board, game_state):
     
     return True
 
-class SimpleFileDialog:
-    """A simple file dialog implementation using pygame"""
-    
-    def __init__(self, screen, title="Select a file", start_dir=None, file_extension=".sgf"):
-        self.screen = screen
-        self.title = title
-        self.file_extension = file_extension
-        
-        # Start in the current program directory if not specified
-        if start_dir is None:
-            self.current_dir = os.path.dirname(os.path.abspath(__file__))
-        else:
-            self.current_dir = start_dir
-            
-        # UI settings
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 32)
-        self.bg_color = (240, 240, 240)
-        self.text_color = (0, 0, 0)
-        self.highlight_color = (200, 200, 255)
-        self.border_color = (100, 100, 100)
-        
-        # File list state
-        self.files = []
-        self.selected_index = 0
-        self.scroll_offset = 0
-        self.max_visible_items = 15
-        
-        # Get initial file list
-        self.update_file_list()
-    
-    def update_file_list(self):
-        """Update the list of files and directories in the current directory"""
-        self.files = []
-        
-        # Add parent directory option
-        self.files.append(("..", True))
-        
-        try:
-            # Get all files and directories in the current directory
-            for item in os.listdir(self.current_dir):
-                full_path = os.path.join(self.current_dir, item)
-                is_dir = os.path.isdir(full_path)
-                
-                # Only include directories and files with the specified extension
-                if is_dir or (not is_dir and item.lower().endswith(self.file_extension)):
-                    self.files.append((item, is_dir))
-            
-            # Sort directories first, then files
-            self.files.sort(key=lambda x: (not x[1], x[0].lower()))
-            
-            # Reset selection and scroll
-            self.selected_index = 0
-            self.scroll_offset = 0
-        except Exception as e:
-            print(f"Error reading directory: {e}")
-    
-    def handle_event(self, event):
-        """Handle pygame events for the file dialog"""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.selected_index = max(0, self.selected_index - 1)
-                # Adjust scroll if needed
-                if self.selected_index < self.scroll_offset:
-                    self.scroll_offset = self.selected_index
-            elif event.key == pygame.K_DOWN:
-                self.selected_index = min(len(self.files) - 1, self.selected_index + 1)
-                # Adjust scroll if needed
-                if self.selected_index >= self.scroll_offset + self.max_visible_items:
-                    self.scroll_offset = self.selected_index - self.max_visible_items + 1
-            elif event.key == pygame.K_RETURN:
-                # Handle selection
-                if self.selected_index < len(self.files):
-                    item, is_dir = self.files[self.selected_index]
-                    
-                    if is_dir:
-                        # Navigate to directory
-                        if item == "..":
-                            self.current_dir = os.path.dirname(self.current_dir)
-                        else:
-                            self.current_dir = os.path.join(self.current_dir, item)
-                        self.update_file_list()
-                        return None
-                    else:
-                        # Return the selected file path
-                        return os.path.join(self.current_dir, item)
-            elif event.key == pygame.K_ESCAPE:
-                # Cancel selection
-                return False
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left click
-                # Calculate which item was clicked
-                mouse_y = event.pos[1]
-                item_height = 30
-                header_height = 60
-                
-                # Check if click is in the file list area
-                if mouse_y > header_height:
-                    clicked_index = self.scroll_offset + (mouse_y - header_height) // item_height
-                    
-                    if 0 <= clicked_index < len(self.files):
-                        if clicked_index == self.selected_index:
-                            # Double-click handling (simplified)
-                            item, is_dir = self.files[self.selected_index]
-                            
-                            if is_dir:
-                                # Navigate to directory
-                                if item == "..":
-                                    self.current_dir = os.path.dirname(self.current_dir)
-                                else:
-                                    self.current_dir = os.path.join(self.current_dir, item)
-                                self.update_file_list()
-                                return None
-                            else:
-                                # Return the selected file path
-                                return os.path.join(self.current_dir, item)
-                        else:
-                            # Single click - update selection
-                            self.selected_index = clicked_index
-            
-            elif event.button == 4:  # Mouse wheel up
-                self.scroll_offset = max(0, self.scroll_offset - 1)
-            elif event.button == 5:  # Mouse wheel down
-                self.scroll_offset = min(
-                    max(0, len(self.files) - self.max_visible_items),
-                    self.scroll_offset + 1
-                )
-        
-        return None
-    
-    def draw(self):
-        """Draw the file dialog"""
-        # Draw background
-        self.screen.fill(self.bg_color)
-        
-        # Draw title
-        title_surf = self.title_font.render(self.title, True, self.text_color)
-        self.screen.blit(title_surf, (20, 10))
-        
-        # Draw current directory
-        dir_surf = self.font.render(f"Directory: {self.current_dir}", True, self.text_color)
-        self.screen.blit(dir_surf, (20, 40))
-        
-        # Draw separator line
-        pygame.draw.line(self.screen, self.border_color, (0, 60), (self.screen.get_width(), 60), 2)
-        
-        # Draw file list
-        item_height = 30
-        visible_range = range(
-            self.scroll_offset,
-            min(len(self.files), self.scroll_offset + self.max_visible_items)
-        )
-        
-        for i, idx in enumerate(visible_range):
-            item, is_dir = self.files[idx]
-            y_pos = 60 + i * item_height
-            
-            # Highlight selected item
-            if idx == self.selected_index:
-                pygame.draw.rect(
-                    self.screen,
-                    self.highlight_color,
-                    (0, y_pos, self.screen.get_width(), item_height)
-                )
-            
-            # Draw item text
-            if is_dir:
-                item_text = f"📁 {item}"
-            else:
-                item_text = f"📄 {item}"
-            
-            text_surf = self.font.render(item_text, True, self.text_color)
-            self.screen.blit(text_surf, (20, y_pos + 5))
-        
-        # Draw scrollbar if needed
-        if len(self.files) > self.max_visible_items:
-            scrollbar_height = self.screen.get_height() - 60
-            thumb_size = scrollbar_height * min(1.0, self.max_visible_items / len(self.files))
-            thumb_pos = 60 + (scrollbar_height - thumb_size) * (self.scroll_offset / max(1, len(self.files) - self.max_visible_items))
-            
-            # Draw scrollbar background
-            pygame.draw.rect(
-                self.screen,
-                (220, 220, 220),
-                (self.screen.get_width() - 20, 60, 20, scrollbar_height)
-            )
-            
-            # Draw scrollbar thumb
-            pygame.draw.rect(
-                self.screen,
-                (180, 180, 180),
-                (self.screen.get_width() - 20, thumb_pos, 20, thumb_size)
-            )
-        
-        # Draw instructions
-        instructions = "Use arrow keys to navigate, Enter to select, Escape to cancel"
-        instr_surf = self.font.render(instructions, True, self.text_color)
-        self.screen.blit(
-            instr_surf,
-            (20, self.screen.get_height() - 30)
-        )
-        
-        pygame.display.flip()
-
 def main():
     # Initialize pygame
     pygame.init()
     
+    # Keep everything but input and expose events out of the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(REDRAW_EVENTS)
+    
     # Set up the display
     WINDOW_WIDTH = 800
     WINDOW_HEIGHT = 800
@@ -663,28 +640,126 @@ def main():
         40
     )
     
-    # Game loop
+    # Buttons hit-tested by a click, all at once, and their indices in the list
+    toolbar_buttons = [statistics_button, load_game_button, move_numbers_button]
+    STATISTICS_BUTTON, LOAD_GAME_BUTTON, MOVE_NUMBERS_BUTTON = range(len(toolbar_buttons))
+    
+    # Stones are drawn into a transparent layer covering the board plus one cell
+    # of margin, and only redrawn when the board or its version changes. Like
+    # every surface blitted each frame, it is kept in the display format
+    stones_layer = pygame.Surface((board_size_pixels + 2 * CELL_SIZE, board_size_pixels + 2 * CELL_SIZE), pygame.SRCALPHA).convert_alpha()
+    stones_board = None  # Board the stones layer was drawn from
+    stones_version = None  # Version of that board when it was drawn
+    
+    # The board color, grid lines and star points never change, so they are
+    # drawn once into a background blitted at the start of every frame
+    board_background = pygame.Surface((window_width, window_height)).convert()
+    board_background.fill(BOARD_COLOR)  # Wooden background color
+    
+    # Draw grid lines
+    for i in range(BOARD_SIZE):
+        # Vertical lines
+        pygame.draw.line(
+            board_background, 
+            (0, 0, 0), 
+            (board_x_offset + i * CELL_SIZE, board_y_offset), 
+            (board_x_offset + i * CELL_SIZE, board_y_offset + (BOARD_SIZE - 1) * CELL_SIZE),
+            2 if i == 0 or i == BOARD_SIZE - 1 else 1
+        )
+        # Horizontal lines
+        pygame.draw.line(
+            board_background, 
+            (0, 0, 0), 
+            (board_x_offset, board_y_offset + i * CELL_SIZE), 
+            (board_x_offset + (BOARD_SIZE - 1) * CELL_SIZE, board_y_offset + i * CELL_SIZE),
+            2 if i == 0 or i == BOARD_SIZE - 1 else 1
+        )
+    
+    # Draw star points (hoshi)
+    star_points = []
+    if BOARD_SIZE == 19:
+        star_points = [(3, 3), (9, 3), (15, 3), (3, 9), (9, 9), (15, 9), (3, 15), (9, 15), (15, 15)]
+    elif BOARD_SIZE == 13:
+        star_points = [(3, 3), (9, 3), (6, 6), (3, 9), (9, 9)]
+    elif BOARD_SIZE == 9:
+        star_points = [(2, 2), (6, 2), (4, 4), (2, 6), (6, 6)]
+    
+    for x, y in star_points:
+        pygame.draw.circle(
+            board_background, 
+            (0, 0, 0), 
+            (board_x_offset + x * CELL_SIZE, board_y_offset + y * CELL_SIZE), 
+            5
+        )
+    
+    # The grid is drawn over the influence squares, so the same lines are also
+    # kept keyed out of the board color, covering the grid and its star points
+    grid_overlay = board_background.copy()
+    grid_overlay.set_colorkey(BOARD_COLOR)
+    grid_area = pygame.Rect(
+        board_x_offset - CELL_SIZE // 2,
+        board_y_offset - CELL_SIZE // 2,
+        board_size_pixels + CELL_SIZE,
+        board_size_pixels + CELL_SIZE
+    )
+    
+    # The influence squares are filled into one transparent overlay over the
+    # same area, composited onto the screen in a single blit
+    influence_overlay = pygame.Surface(grid_area.size, pygame.SRCALPHA).convert_alpha()
+    overlay_x_offset = board_x_offset - grid_area.x  # First column in overlay coordinates
+    overlay_y_offset = board_y_offset - grid_area.y  # First row in overlay coordinates
+    
+    # Stone sprites by color, blitted into the stones layer
+    stone_sprites = {
+        BLACK: get_marker_surface("circle", 2 * STONE_RADIUS + 1, BLACK_COLOR),
+        WHITE: get_marker_surface("circle", 2 * STONE_RADIUS + 1, WHITE_COLOR),
+    }
+    
+    # Fonts used by the frame loop, loaded once
+    move_number_font = get_font(None, 20)
+    player_font = get_font('Arial', 20)
+    score_font = get_font('Arial', 24)
+    
+    # Labels whose text never changes, rendered once
+    player_label = player_font.render("Current Player: ", True, BLACK_COLOR)
+    separator_label = score_font.render("-", True, BLACK_COLOR)
+    
+    # Move number text is rendered on first use and kept for later frames
+    number_surfaces = {}  # Rendered move numbers by (number, color)
+    number_blits = []  # (surface, rect) pairs for the batched move number draw
+    
+    # Game loop, capped at FPS frames per second so an idle board sleeps
+    # between frames instead of redrawing as fast as possible. The board only
+    # changes on events, so frames without any are not drawn at all
+    clock = pygame.time.Clock()
     running = True
+    needs_redraw = True
     while running:
+        # Unfiltered, so the events are handled in the order they arrived;
+        # set_allowed(REDRAW_EVENTS) keeps every other type out of the queue
         for event in pygame.event.get():
+            needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
                     mouse_pos = event.pos
                     
+                    # Find the clicked button, if any, in one call; -1 means none
+                    clicked_button = pygame.Rect(mouse_pos, (1, 1)).collidelist(toolbar_buttons)
+                    
                     # Check if statistics button was clicked
-                    if statistics_button.collidepoint(mouse_pos):
+                    if clicked_button == STATISTICS_BUTTON:
                         show_influence = not show_influence
                         # No need to toggle territory since we don't show it anymore
                     
                     # Check if load game button was clicked
-                    elif load_game_button.collidepoint(mouse_pos):
-                        print("Load game button clicked")
+                    elif clicked_button == LOAD_GAME_BUTTON:
+                        logger.debug("Load game button clicked")
                         # Open file dialog to select SGF file
                         sgf_file_path = load_sgf_file(screen)
                         if sgf_file_path:
-                            print(f"Selected SGF file: {sgf_file_path}")
+                            logger.debug("Selected SGF file: %s", sgf_file_path)
                             # Load the game from the SGF file
                             if load_game_from_sgf(sgf_file_path, board, game_state):
                                 print("Game loaded successfully")
@@ -692,22 +767,23 @@ def main():
                                 print("Failed to load game")
                     
                     # Check if move numbers button was clicked
-                    elif move_numbers_button.collidepoint(mouse_pos):
+                    elif clicked_button == MOVE_NUMBERS_BUTTON:
                         show_move_numbers = not show_move_numbers
                     
                     else:
                         # Get board coordinates from mouse position
                         x, y = event.pos
-                        board_x = round((x - board_x_offset) / CELL_SIZE)
-                        board_y = round((y - board_y_offset) / CELL_SIZE)
+                        # Nearest intersection in integer math; halfway points round up
+                        board_x = (x - board_x_offset + CELL_SIZE // 2) // CELL_SIZE
+                        board_y = (y - board_y_offset + CELL_SIZE // 2) // CELL_SIZE
                         
                         # Check if the coordinates are valid
                         if 0 <= board_x < BOARD_SIZE and 0 <= board_y < BOARD_SIZE:
                             # Try to place a stone
                             if game_state.place_stone(board_x, board_y):
-                                print(f"Stone placed at ({board_x}, {board_y})")
+                                logger.debug("Stone placed at (%d, %d)", board_x, board_y)
                             else:
-                                print(f"Invalid move at ({board_x}, {board_y})")
+                                logger.debug("Invalid move at (%d, %d)", board_x, board_y)
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
@@ -724,8 +800,14 @@ def main():
                     show_influence = not show_influence
                     # Don't toggle territory when toggling influence
         
-        # Draw the board
-        screen.fill(BOARD_COLOR)  # Wooden background color
+        # Nothing changed since the last frame, which is still on screen
+        if not needs_redraw:
+            clock.tick(FPS)
+            continue
+        needs_redraw = False
+        
+        # Draw the board background with its grid
+        screen.blit(board_background, (0, 0))
         
         # Get territory and influence data if needed
         territory_data = None
@@ -738,147 +820,75 @@ def main():
             # Calculate influence map
             territory_data = game_state.get_potential_territory()
             influence_map = territory_data['influence']
-            max_influence = max(1.0, np.max(np.abs(influence_map)))  # Normalize influence
+            black_influence_total, white_influence_total, squares = get_influence_squares(
+                influence_map, board.board, overlay_x_offset, overlay_y_offset
+            )
             
-            # Calculate total influence for each player
-            for y in range(BOARD_SIZE):
-                for x in range(BOARD_SIZE):
-                    influence_value = influence_map[y, x]
-                    if influence_value > 0:  # Black influence
-                        black_influence_total += influence_value
-                    elif influence_value < 0:  # White influence (negative values)
-                        white_influence_total -= influence_value  # Convert to positive
+            # Fill a translucent square centered on each point into the overlay;
+            # squares are smaller than a cell, so they never overlap
+            influence_overlay.fill((0, 0, 0, 0))
+            for left, top, rect_size, alpha, shade in squares.tolist():
+                influence_overlay.fill((shade, shade, shade, alpha), (left, top, rect_size, rect_size))
+            
+            # Blend every influence square onto the board in one blit
+            screen.blit(influence_overlay, grid_area)
+        
+        # Keep the grid lines and star points on top of the influence squares
+        if show_influence:
+            screen.blit(grid_overlay, grid_area, grid_area)
+        
+        # Redraw the stones layer only when the board has changed since it was drawn
+        if stones_board is not board or stones_version != board.version:
+            stones_layer.fill((0, 0, 0, 0))
+            ys, xs = np.nonzero(board.board)
+            stones_layer.blits([
+                (stone_sprites[stone], (x * CELL_SIZE + CELL_SIZE - STONE_RADIUS, y * CELL_SIZE + CELL_SIZE - STONE_RADIUS))
+                for y, x, stone in zip(ys.tolist(), xs.tolist(), board.board[ys, xs].tolist())
+            ], doreturn=False)
+            stones_board, stones_version = board, board.version
+        screen.blit(stones_layer, (board_x_offset - CELL_SIZE, board_y_offset - CELL_SIZE))
+        
+        # Draw move numbers if enabled
+        if show_move_numbers:
+            board_rows = board.board.tolist()
             
-            # Draw influence
+            # Move number of each point, built in one pass over the history so a
+            # point that was captured and played again shows its latest move
+            move_numbers = {
+                (move_x, move_y): i
+                for i, (move_x, move_y, _) in enumerate(game_state.move_history.tolist(), 1)
+            }
             for y in range(BOARD_SIZE):
                 for x in range(BOARD_SIZE):
-                    if board.get_stone(x, y) == EMPTY:
-                        influence_value = influence_map[y, x]
-                        
-                        # Skip very small influence values
-                        if abs(influence_value) < 0.1:
-                            continue
-                        
+                    stone = board_rows[y][x]
+                    if stone != EMPTY:
                         # Calculate position
                         pos_x = board_x_offset + x * CELL_SIZE
                         pos_y = board_y_offset + y * CELL_SIZE
                         
-                        # Calculate rectangle size based on influence value
-                        # Apply a scaling factor to make rectangles bigger overall
-                        base_size_factor = 0.3  # Minimum size factor (for very small influence)
-                        max_size_factor = 0.9   # Maximum size factor (for maximum influence)
-                        
-                        # Scale the influence value to a size between base_size_factor and max_size_factor
-                        size_factor = base_size_factor + (max_size_factor - base_size_factor) * min(1.0, abs(influence_value) / max_influence)
-                        
-                        # Calculate the actual pixel size
-                        rect_size = int(CELL_SIZE * size_factor)
-                        
-                        # Ensure minimum size for visibility
-                        rect_size = max(rect_size, 8)
-                        
-                        # Create rectangle centered on the point
-                        rect = pygame.Rect(
-                            pos_x - rect_size // 2,
-                            pos_y - rect_size // 2,
-                            rect_size,
-                            rect_size
-                        )
-                        
-                        # Color based on which player has influence (black or white)
-                        if influence_value > 0:  # Black influence
-                            # Create a black color with transparency based on influence value
-                            alpha = int(min(255, 100 + 155 * (abs(influence_value) / max_influence)))
-                            # Create a surface with per-pixel alpha
-                            s = pygame.Surface((rect_size, rect_size), pygame.SRCALPHA)
-                            s.fill((0, 0, 0, alpha))  # Black with transparency
-                            screen.blit(s, (pos_x - rect_size // 2, pos_y - rect_size // 2))
-                        elif influence_value < 0:  # White influence
-                            # Create a white color with transparency based on influence value
-                            alpha = int(min(255, 100 + 155 * (abs(influence_value) / max_influence)))
-                            # Create a surface with per-pixel alpha
-                            s = pygame.Surface((rect_size, rect_size), pygame.SRCALPHA)
-                            s.fill((255, 255, 255, alpha))  # White with transparency
-                            screen.blit(s, (pos_x - rect_size // 2, pos_y - rect_size // 2))
-        
-        # Draw grid lines
-        for i in range(BOARD_SIZE):
-            # Vertical lines
-            pygame.draw.line(
-                screen, 
-                (0, 0, 0), 
-                (board_x_offset + i * CELL_SIZE, board_y_offset), 
-                (board_x_offset + i * CELL_SIZE, board_y_offset + (BOARD_SIZE - 1) * CELL_SIZE),
-                2 if i == 0 or i == BOARD_SIZE - 1 else 1
-            )
-            # Horizontal lines
-            pygame.draw.line(
-                screen, 
-                (0, 0, 0), 
-                (board_x_offset, board_y_offset + i * CELL_SIZE), 
-                (board_x_offset + (BOARD_SIZE - 1) * CELL_SIZE, board_y_offset + i * CELL_SIZE),
-                2 if i == 0 or i == BOARD_SIZE - 1 else 1
-            )
-        
-        # Draw star points (hoshi)
-        star_points = []
-        if BOARD_SIZE == 19:
-            star_points = [(3, 3), (9, 3), (15, 3), (3, 9), (9, 9), (15, 9), (3, 15), (9, 15), (15, 15)]
-        elif BOARD_SIZE == 13:
-            star_points = [(3, 3), (9, 3), (6, 6), (3, 9), (9, 9)]
-        elif BOARD_SIZE == 9:
-            star_points = [(2, 2), (6, 2), (4, 4), (2, 6), (6, 6)]
-        
-        for point in star_points:
-            x, y = point
-            pygame.draw.circle(
-                screen, 
-                (0, 0, 0), 
-                (board_x_offset + x * CELL_SIZE, board_y_offset + y * CELL_SIZE), 
-                5
-            )
-        
-        # Draw stones
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                stone = board.get_stone(x, y)
-                if stone != EMPTY:
-                    # Calculate position
-                    pos_x = board_x_offset + x * CELL_SIZE
-                    pos_y = board_y_offset + y * CELL_SIZE
-                    
-                    # Draw stone
-                    if stone == BLACK:
-                        pygame.draw.circle(screen, BLACK_COLOR, (pos_x, pos_y), STONE_RADIUS)
-                    else:
-                        pygame.draw.circle(screen, WHITE_COLOR, (pos_x, pos_y), STONE_RADIUS)
-                    
-                    # Draw move number if enabled
-                    if show_move_numbers:
-                        # Find the move number for this position
-                        move_number = None
-                        for i, (move_x, move_y, move_color) in enumerate(game_state.move_history):
-                            if move_x == x and move_y == y:
-                                move_number = i + 1  # 1-based move numbering
-                                break
+                        # Find the 1-based move number for this position
+                        move_number = move_numbers.get((x, y))
                         
                         if move_number is not None:
                             # Choose text color based on stone color
                             text_color = WHITE_COLOR if stone == BLACK else BLACK_COLOR
                             
-                            # Draw move number
-                            font = pygame.font.Font(None, 20)
-                            text = font.render(str(move_number), True, text_color)
-                            text_rect = text.get_rect(center=(pos_x, pos_y))
-                            screen.blit(text, text_rect)
+                            # Queue the move number, rendered once per number and color
+                            key = (move_number, text_color)
+                            text = number_surfaces.get(key)
+                            if text is None:
+                                text = number_surfaces[key] = move_number_font.render(str(move_number), True, text_color)
+                            number_blits.append((text, text.get_rect(center=(pos_x, pos_y))))
+            
+            # Draw every move number in one batched call
+            screen.blits(number_blits, doreturn=False)
+            number_blits.clear()
         
         # Display current player with stone icon
-        font = pygame.font.SysFont('Arial', 20)
         player_indicator_x = 20
         
         # Display current player text
-        text = f"Current Player: "
-        text_surface = font.render(text, True, BLACK_COLOR)
+        text_surface = player_label
         text_width = text_surface.get_width()
         
         # Center the player indicator
@@ -902,7 +912,6 @@ def main():
         # Display influence scores if statistics is enabled (at the bottom of the board)
         if show_influence and territory_data:
             # Create a larger font for the score display
-            score_font = pygame.font.SysFont('Arial', 24)
             
             # Position for the score display at the bottom of the board
             score_y = board_y_offset + board_size_pixels + 30
@@ -931,13 +940,13 @@ def main():
             screen.blit(black_score_surface, (black_score_x - 15, score_y - 12))
             
             # Draw separator
-            separator_text = "-"
-            separator_surface = score_font.render(separator_text, True, BLACK_COLOR)
+            separator_surface = separator_label
             separator_x = WINDOW_WIDTH // 2
             screen.blit(separator_surface, (separator_x - separator_surface.get_width() // 2, score_y - 12))
         
         # Update the display
         pygame.display.flip()
+        clock.tick(FPS)
     
     # Clean up
     pygame.quit()
@@ -0,0 +1,164 @@
+"""
+Tests for the accelerated kernels.
+
+Without Numba the kernels run as plain Python functions, so each compiled
+kernel is compared with its own uncompiled body (py_func), and the whole
+game is run once in a subprocess where Numba and SciPy cannot be imported.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import game._accelerated as accelerated
+from game.board import Board
+from game.constants import BLACK, WHITE, EMPTY
+from tests.test_board import random_moves
+from tests.test_game_state import random_game
+
+requires_numba = pytest.mark.skipif(not accelerated.NUMBA_AVAILABLE, reason="Numba is not installed")
+
+
+def random_boards(size, seed, count=20):
+    """Boards filled to different densities by random legal and illegal moves."""
+    for i in range(count):
+        board = Board(size)
+        for x, y, color in random_moves(size, i * size, seed * count + i):
+            board.place_stone(x, y, color)
+        yield board
+
+
+def reference_correlate(values, kernel):
+    """Correlate with zero padding by direct summation."""
+    radius = kernel.shape[0] // 2
+    rows, cols = values.shape
+    padded = np.zeros((rows + 2 * radius, cols + 2 * radius), dtype=np.float64)
+    padded[radius:radius + rows, radius:radius + cols] = values
+    out = np.zeros((rows, cols))
+    for ky in range(kernel.shape[0]):
+        for kx in range(kernel.shape[1]):
+            out += kernel[ky, kx] * padded[ky:ky + rows, kx:kx + cols]
+    return out
+
+
+@requires_numba
+@pytest.mark.parametrize("size", [5, 9, 19])
+def test_find_group_and_liberties_matches_python(size):
+    for board in random_boards(size, 0):
+        width = board.size + 2
+        for point in np.flatnonzero((board.flat_board == BLACK) | (board.flat_board == WHITE)):
+            group, has_liberty = accelerated.find_group_and_liberties(board.flat_board, point, width)
+            expected_group, expected_liberty = accelerated.find_group_and_liberties.py_func(
+                board.flat_board, point, width)
+            assert has_liberty == expected_liberty
+            assert group.tolist() == expected_group.tolist()
+
+            # Without a liberty the group is complete
+            if not has_liberty:
+                assert sorted(group.tolist()) == sorted(
+                    board._point(x, y) for x, y in board.find_group(*board._coords(point)))
+
+
+@requires_numba
+@pytest.mark.parametrize("size", [5, 9, 19])
+def test_resolve_captures_matches_python(size):
+    for board in random_boards(size, 1):
+        width = board.size + 2
+        for point in np.flatnonzero(board.flat_board == EMPTY)[::3]:
+            results = []
+            for kernel in (accelerated.resolve_captures, accelerated.resolve_captures.py_func):
+                flat = board.flat_board.copy()
+                flat[point] = BLACK
+                captured = np.empty(flat.size, dtype=np.int32)
+                n_captured, hash_delta, has_liberty = kernel(flat, point, width, board._zobrist_keys, captured)
+                results.append((flat.tolist(), sorted(captured[:n_captured].tolist()), int(hash_delta), bool(has_liberty)))
+            assert results[0] == results[1]
+
+
+@requires_numba
+@pytest.mark.parametrize("size", [5, 9, 19])
+def test_label_empty_regions_matches_python(size):
+    for board in random_boards(size, 2):
+        labels, borders = accelerated.label_empty_regions(board.flat_board, board.size + 2)
+        expected_labels, expected_borders = accelerated.label_empty_regions.py_func(board.flat_board, board.size + 2)
+        assert labels.tolist() == expected_labels.tolist()
+        assert borders.tolist() == expected_borders.tolist()
+        assert set(borders.tolist()) <= {EMPTY, BLACK, WHITE, BLACK | WHITE}
+
+
+@pytest.mark.parametrize("shape", [(9, 9), (19, 19), (7, 40), (70, 33)])
+@pytest.mark.parametrize("kernel_size", [1, 3, 5, 13])
+def test_correlate_constant_matches_reference(shape, kernel_size):
+    rng = np.random.default_rng(kernel_size)
+    values = rng.standard_normal(shape).astype(np.float32)
+    kernel = rng.standard_normal((kernel_size, kernel_size)).astype(np.float32)
+    kernel[rng.random(kernel.shape) < 0.4] = 0  # Zero weights are skipped
+    expected = reference_correlate(values, kernel)
+
+    kernels = [accelerated.correlate_constant]
+    if accelerated.NUMBA_AVAILABLE:
+        kernels.append(accelerated.correlate_constant.py_func)
+    for correlate in kernels:
+        out = np.empty_like(values)
+        assert correlate(values, kernel, out) is out
+        np.testing.assert_allclose(out, expected, rtol=1e-4, atol=1e-4)
+
+
+@requires_numba
+@pytest.mark.parametrize("size", [9, 19])
+def test_influence_squares_matches_python(size):
+    for seed, n_moves in enumerate((0, 3, size * 2, size * size)):
+        game = random_game(size, n_moves, seed)
+        args = (game.calculate_influence(), game.board.board, 30, 15, 15)
+        black, white, squares = accelerated.influence_squares(*args)
+        expected_black, expected_white, expected = accelerated.influence_squares.py_func(*args)
+        assert squares.tolist() == expected.tolist()
+        assert black == pytest.approx(expected_black)
+        assert white == pytest.approx(expected_white)
+
+
+# Plays the same random games as random_game and prints what the game computed
+_GAME_SCRIPT = """
+import json, sys
+for module in sys.argv[1:]:
+    sys.modules[module] = None
+from game import _accelerated, game_state
+from tests.test_game_state import random_game
+results = []
+for size, n_moves, seed in ((9, 60, 0), (19, 200, 1)):
+    game = random_game(size, n_moves, seed)
+    territory = game.calculate_territory()
+    results.append({
+        'board': game.board.board.tolist(),
+        'territory': territory['territory_map'].tolist(),
+        'influence': game.calculate_influence().tolist(),
+        'legal': sorted(map(list, game.get_legal_moves())),
+        'captured': {str(color): count for color, count in game.captured_stones.items()},
+    })
+print(json.dumps({'numba': _accelerated.NUMBA_AVAILABLE, 'scipy': game_state.SCIPY_AVAILABLE, 'games': results}))
+"""
+
+
+def run_game_script(*blocked_modules):
+    """Run _GAME_SCRIPT in a fresh interpreter with some modules made unimportable."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", _GAME_SCRIPT, *blocked_modules], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("blocked", [("numba",), ("numba", "scipy")], ids=["no-numba", "no-numba-no-scipy"])
+def test_game_without_optional_dependencies(blocked):
+    expected = run_game_script()
+    result = run_game_script(*blocked)
+
+    assert not result['numba']
+    assert result['scipy'] == (expected['scipy'] and "scipy" not in blocked)
+    for game, expected_game in zip(result['games'], expected['games']):
+        for key in ('board', 'territory', 'legal', 'captured'):
+            assert game[key] == expected_game[key]
+        np.testing.assert_allclose(game['influence'], expected_game['influence'], atol=1e-5)
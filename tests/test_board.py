@@ -0,0 +1,233 @@
+"""
+Tests for the board module.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+import game.board as board_module
+from game.board import Board
+from game.constants import BLACK, WHITE, EMPTY
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "python"])
+def numba_available(request, monkeypatch):
+    """Run a test with the compiled kernels and again with the pure-Python fallback."""
+    if request.param and not board_module.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(board_module, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+def test_place_stone_returns_bool(numba_available):
+    board = Board(9)
+    assert board.place_stone(4, 4, BLACK) is True
+    assert board.last_captured == 0
+
+
+def test_illegal_moves_are_not_placed(numba_available):
+    board = Board(9)
+    board.place_stone(0, 1, BLACK)
+    board.place_stone(1, 0, BLACK)
+
+    # Occupied point, off the board and suicide
+    assert board.place_stone(0, 1, WHITE) is False
+    assert board.place_stone(9, 0, WHITE) is False
+    assert board.place_stone(0, 0, WHITE) is False
+    assert board.stone_counts == {BLACK: 2, WHITE: 0}
+
+
+def test_last_captured_counts_the_captured_stones(numba_available):
+    board = Board(9)
+    board.place_stone(0, 0, WHITE)
+    board.place_stone(1, 0, WHITE)
+    board.place_stone(0, 1, BLACK)
+    board.place_stone(1, 1, BLACK)
+    assert board.place_stone(2, 0, BLACK)
+    assert board.last_captured == 2
+    assert board.stone_counts == {BLACK: 3, WHITE: 0}
+
+
+def test_find_group_returns_the_group_points(numba_available):
+    board = Board(9)
+    for x, y in ((2, 2), (3, 2), (3, 3)):
+        board.place_stone(x, y, BLACK)
+    board.place_stone(5, 5, WHITE)
+
+    group = board.find_group(3, 2)
+    assert isinstance(group, list)
+    assert sorted(group) == [(2, 2), (3, 2), (3, 3)]
+    assert board.has_liberties(group)
+    assert board.find_group(5, 5) == [(5, 5)]
+    assert board.find_group(0, 0) == []
+
+
+def test_find_group_of_a_group_without_liberties(numba_available):
+    board = Board(9)
+    board.place_stone(0, 0, WHITE)
+    board.place_stone(1, 0, BLACK)
+    board.flat_board[board._point(0, 1)] = BLACK  # Surround without capturing
+
+    group = board.find_group(0, 0)
+    assert group == [(0, 0)]
+    assert not board.has_liberties(group)
+
+
+def zobrist_hash(board):
+    """Recompute the Zobrist hash of a board from scratch."""
+    points = np.flatnonzero(board.flat_board == BLACK), np.flatnonzero(board.flat_board == WHITE)
+    keys = board._zobrist_keys
+    return int(np.bitwise_xor.reduce(np.concatenate((keys[points[0], BLACK], keys[points[1], WHITE]))))
+
+
+def board_snapshot(board):
+    """Everything place_stone and undo_move must keep consistent."""
+    return (board.board.copy(), board._hash, board._last_hash, dict(board.stone_counts),
+            board.ko_position, set(board.previous_board_states), list(board._state_order))
+
+
+def copy_board(board):
+    """Independent copy of the position, history and ko state of a board."""
+    trial = Board(board.size)
+    trial.flat_board[:] = board.flat_board
+    trial._hash = board._hash
+    trial.stone_counts = dict(board.stone_counts)
+    trial.ko_position = board.ko_position
+    trial.previous_board_states = set(board.previous_board_states)
+    trial._state_order = list(board._state_order)
+    return trial
+
+
+def random_moves(size, n_moves, seed):
+    """Random (x, y, color) moves, alternating colors, mostly on the board."""
+    rng = random.Random(seed)
+    return [(rng.randrange(-1, size + 1), rng.randrange(-1, size + 1), BLACK if i % 2 == 0 else WHITE)
+            for i in range(n_moves)]
+
+
+@pytest.mark.parametrize("size", [5, 9, 19])
+@pytest.mark.parametrize("seed", range(4))
+def test_compiled_capture_matches_python_fallback(monkeypatch, size, seed):
+    if not board_module.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+    compiled, fallback = Board(size), Board(size)
+
+    for x, y, color in random_moves(size, size * size * 3, seed):
+        monkeypatch.setattr(board_module, "NUMBA_AVAILABLE", True)
+        placed = compiled.place_stone(x, y, color)
+        monkeypatch.setattr(board_module, "NUMBA_AVAILABLE", False)
+        assert fallback.place_stone(x, y, color) == placed
+        assert compiled.last_captured == fallback.last_captured
+
+        compiled_state, fallback_state = board_snapshot(compiled), board_snapshot(fallback)
+        np.testing.assert_array_equal(compiled_state[0], fallback_state[0])
+        assert compiled_state[1:] == fallback_state[1:]
+
+
+@pytest.mark.parametrize("size", [5, 9, 19])
+def test_hash_and_stone_counts_follow_the_board(numba_available, size):
+    board = Board(size)
+    for x, y, color in random_moves(size, size * size * 3, size):
+        board.place_stone(x, y, color)
+        assert board._hash == zobrist_hash(board)
+        assert board.stone_counts == {BLACK: int(np.count_nonzero(board.board == BLACK)),
+                                      WHITE: int(np.count_nonzero(board.board == WHITE))}
+
+
+@pytest.mark.parametrize("size", [5, 9])
+def test_undo_restores_the_previous_position(numba_available, size):
+    board = Board(size)
+    for x, y, color in random_moves(size, size * size * 3, size + 1):
+        before = board_snapshot(board)
+        version = board.version
+        if not board.place_stone(x, y, color):
+            after = board_snapshot(board)
+            np.testing.assert_array_equal(after[0], before[0])
+            assert after[1:] == before[1:]
+            continue
+
+        placed = board_snapshot(board)
+        assert board.undo_move()
+        assert not board.undo_move()  # Only one level of undo
+        undone = board_snapshot(board)
+        np.testing.assert_array_equal(undone[0], before[0])
+        assert undone[1:] == before[1:]
+        assert board.version > version
+
+        # Replaying the move gives the same position again
+        assert board.place_stone(x, y, color)
+        replayed = board_snapshot(board)
+        np.testing.assert_array_equal(replayed[0], placed[0])
+        assert replayed[1:] == placed[1:]
+
+
+def test_ko_recapture_is_rejected(numba_available):
+    board = Board(9)
+    for x, y in ((1, 0), (0, 1), (2, 1)):
+        board.place_stone(x, y, BLACK)
+    for x, y in ((1, 1), (0, 2), (2, 2), (1, 3)):
+        board.place_stone(x, y, WHITE)
+
+    # Black takes the ko
+    assert board.place_stone(1, 2, BLACK)
+    assert board.last_captured == 1
+    assert board.get_stone(1, 1) == EMPTY
+    position = board_snapshot(board)
+
+    # White cannot retake at once, since that repeats the previous position
+    assert not board.place_stone(1, 1, WHITE)
+    assert (1, 1) not in board.get_legal_moves(WHITE)
+    after = board_snapshot(board)
+    np.testing.assert_array_equal(after[0], position[0])
+    assert after[1:] == position[1:]
+
+
+def test_is_ko_compares_with_the_previous_position():
+    board = Board(9)
+    assert not board.is_ko()
+    board.place_stone(4, 4, BLACK)
+    assert not board.is_ko()
+
+
+@pytest.mark.parametrize("size", [5, 9])
+def test_legal_moves_match_trial_placement(numba_available, size):
+    board = Board(size)
+    for i, (x, y, color) in enumerate(random_moves(size, size * size * 2, size + 2)):
+        board.place_stone(x, y, color)
+        if i % 5:
+            continue
+
+        opponent = WHITE if color == BLACK else BLACK
+        before = board_snapshot(board)
+        version, last_move, last_captured = board.version, board._last_move, board.last_captured
+
+        expected = []
+        for ty in range(size):
+            for tx in range(size):
+                if copy_board(board).place_stone(tx, ty, opponent):
+                    expected.append((tx, ty))
+
+        legal_moves = board.get_legal_moves(opponent)
+        assert sorted(legal_moves) == sorted(expected)
+        assert board.get_legal_moves_cached(opponent) == tuple(legal_moves)
+        assert board.get_legal_moves_cached(opponent) == tuple(legal_moves)
+
+        # The probes leave the position as it was
+        after = board_snapshot(board)
+        np.testing.assert_array_equal(after[0], before[0])
+        assert after[1:] == before[1:]
+        assert (board.version, board._last_move, board.last_captured) == (version, last_move, last_captured)
+
+
+def test_clear_empties_the_board(numba_available):
+    board = Board(9)
+    for x, y, color in random_moves(9, 60, 0):
+        board.place_stone(x, y, color)
+    version = board.version
+    board.clear()
+    assert not board.board.any()
+    assert board._hash == 0
+    assert board.stone_counts == {BLACK: 0, WHITE: 0}
+    assert board.version > version
@@ -0,0 +1,219 @@
+"""
+Tests for the game state module.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+import game.game_state as game_state_module
+from game.board import Board
+from game.constants import BLACK, WHITE, EMPTY
+from game.game_state import GameState, calculate_influence_batch
+
+# Territory labelling and influence stencils run on Numba, then SciPy, then NumPy
+BACKENDS = {
+    "numba": (True, False),
+    "scipy": (False, True),
+    "python": (False, False),
+}
+
+
+def random_game(size, n_moves, seed):
+    """Play random moves, mostly on empty points, and return the game state."""
+    rng = random.Random(seed)
+    game_state = GameState(Board(size))
+    for _ in range(n_moves):
+        game_state.place_stone(rng.randrange(size), rng.randrange(size))
+    return game_state
+
+
+def use_backend(monkeypatch, name):
+    """Make the game state module use one territory and influence backend."""
+    numba, scipy = BACKENDS[name]
+    if numba and not game_state_module.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+    if scipy and not game_state_module.SCIPY_AVAILABLE:
+        pytest.skip("SciPy is not installed")
+    monkeypatch.setattr(game_state_module, "NUMBA_AVAILABLE", numba)
+    monkeypatch.setattr(game_state_module, "SCIPY_AVAILABLE", scipy)
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request, monkeypatch):
+    """Run a test once per territory and influence backend."""
+    use_backend(monkeypatch, request.param)
+    return request.param
+
+
+def reference_territory(board):
+    """Territory map from a plain flood fill over (x, y) points, independent of the game code."""
+    size = board.size
+    territory = np.full((size, size), EMPTY)
+    seen = set()
+    for y in range(size):
+        for x in range(size):
+            if board.board[y, x] != EMPTY or (x, y) in seen:
+                continue
+            region, border, stack = [], set(), [(x, y)]
+            seen.add((x, y))
+            while stack:
+                cx, cy = stack.pop()
+                region.append((cx, cy))
+                for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                    if 0 <= nx < size and 0 <= ny < size:
+                        stone = board.board[ny, nx]
+                        if stone == EMPTY and (nx, ny) not in seen:
+                            seen.add((nx, ny))
+                            stack.append((nx, ny))
+                        elif stone != EMPTY:
+                            border.add(int(stone))
+            if len(border) == 1:
+                owner = border.pop()
+                for cx, cy in region:
+                    territory[cy, cx] = owner
+    return territory
+
+
+@pytest.mark.parametrize("size", [5, 9, 19])
+@pytest.mark.parametrize("seed", range(3))
+def test_territory_matches_reference(backend, size, seed):
+    for n_moves in (0, size, size * size // 2, size * size * 2):
+        game = random_game(size, n_moves, seed)
+        territory = game.calculate_territory()
+        expected = reference_territory(game.board)
+        np.testing.assert_array_equal(territory['territory_map'], expected)
+        assert territory[BLACK] == np.count_nonzero(expected == BLACK)
+        assert territory[WHITE] == np.count_nonzero(expected == WHITE)
+
+
+def test_territory_of_a_walled_corner(backend):
+    game = GameState(Board(9))
+    for i in range(3):
+        game.board.place_stone(2, i, BLACK)
+        game.board.place_stone(i, 2, BLACK)
+    game.board.place_stone(6, 6, WHITE)
+
+    territory = game.calculate_territory()
+    assert territory[BLACK] == 4
+    assert territory[WHITE] == 0
+    assert territory['territory_map'][0, 0] == BLACK
+    assert game.check_surrounded_by(0, 0) == EMPTY
+    assert game.check_surrounded_by(1, 1) == BLACK
+
+
+@pytest.mark.parametrize("size", [5, 9, 19])
+def test_influence_is_the_same_on_every_backend(monkeypatch, size):
+    games = [random_game(size, n_moves, seed) for seed, n_moves in enumerate((0, 1, size * 2, size * size))]
+    maps = {}
+    for name in BACKENDS:
+        numba, scipy = BACKENDS[name]
+        if (numba and not game_state_module.NUMBA_AVAILABLE) or (scipy and not game_state_module.SCIPY_AVAILABLE):
+            continue
+        use_backend(monkeypatch, name)
+        maps[name] = [np.array(GameState(game.board).calculate_influence()) for game in games]
+        maps[name + " batch"] = list(calculate_influence_batch([game.board for game in games]))
+
+    reference = maps.pop("python")
+    for name, backend_maps in maps.items():
+        for influence, expected in zip(backend_maps, reference):
+            np.testing.assert_allclose(influence, expected, atol=1e-5, err_msg=name)
+
+
+def test_influence_sign_follows_the_stones(backend):
+    game = GameState(Board(9))
+    game.board.place_stone(2, 2, BLACK)
+    game.board.place_stone(6, 6, WHITE)
+    influence = game.calculate_influence()
+    assert influence.dtype == np.float32
+    assert influence[2, 3] > 0 and influence[6, 5] < 0
+    assert influence[2, 2] == pytest.approx(1.5) and influence[6, 6] == pytest.approx(-1.5)
+
+
+def test_caches_follow_the_board_version():
+    game = random_game(9, 30, 0)
+    territory = game.calculate_territory()
+    influence = game.calculate_influence()
+    potential = game.get_potential_territory()
+
+    # Unchanged position: the same objects come back, and their maps are read-only
+    assert game.calculate_territory() is territory
+    assert game.calculate_influence() is influence
+    assert game.get_potential_territory() is potential
+    for array in (territory['territory_map'], influence, potential['potential_territory_map']):
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[0, 0] = 0
+
+    # A move made on the board directly still drops the caches
+    x, y = map(int, np.argwhere(game.board.board == EMPTY)[0][::-1])
+    assert game.board.place_stone(x, y, game.current_player)
+    assert game.calculate_territory() is not territory
+    assert game.calculate_influence() is not influence
+    np.testing.assert_array_equal(game.calculate_territory()['territory_map'], reference_territory(game.board))
+
+    # So does undoing it, which brings back the original maps' contents
+    assert game.board.undo_move()
+    np.testing.assert_array_equal(game.calculate_territory()['territory_map'], territory['territory_map'])
+    np.testing.assert_allclose(game.calculate_influence(), influence)
+
+    # invalidate() drops them without a board change
+    cached = game.get_potential_territory()
+    game.invalidate()
+    assert game.get_potential_territory() is not cached
+
+
+def test_score_counts_stones_territory_and_komi():
+    game = GameState(Board(9))
+    for i in range(3):
+        game.board.place_stone(2, i, BLACK)
+        game.board.place_stone(i, 2, BLACK)
+    game.board.place_stone(6, 6, WHITE)
+    assert game.calculate_score() == {BLACK: 5 + 4, WHITE: 1 + 6.5}
+
+
+def test_game_state_records_moves_and_captures():
+    game = GameState(Board(9))
+    for x, y in ((1, 0), (0, 0), (0, 1)):
+        assert game.place_stone(x, y)
+    assert game.captured_stones == {BLACK: 1, WHITE: 0}
+    assert not game.place_stone(0, 1)
+    assert not game.pass_turn()
+    assert game.pass_turn()
+    assert game.is_game_over()
+    assert game.move_history.tolist() == [[1, 0, BLACK], [0, 0, WHITE], [0, 1, BLACK],
+                                          [-1, -1, WHITE], [-1, -1, BLACK]]
+
+
+@pytest.mark.parametrize("size", [9, 19])
+def test_influence_batch_matches_single_positions(size):
+    games = [random_game(size, n_moves, seed) for seed, n_moves in enumerate((0, 5, size * 2, size * 4))]
+
+    batch = calculate_influence_batch([game.board for game in games])
+
+    assert batch.shape == (len(games), size, size)
+    assert batch.dtype == np.float32
+    for influence, game in zip(batch, games):
+        np.testing.assert_allclose(influence, game.calculate_influence(), atol=1e-5)
+
+
+def test_influence_batch_rejects_no_boards():
+    with pytest.raises(ValueError, match="at least one board"):
+        calculate_influence_batch([])
+
+
+def test_influence_batch_rejects_mixed_sizes():
+    with pytest.raises(ValueError, match="same size"):
+        calculate_influence_batch([Board(9), Board(13)])
+
+
+def test_influence_batch_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown influence backend"):
+        calculate_influence_batch([Board(9)], backend='opencl')
+
+
+def test_influence_batch_without_cupy(monkeypatch):
+    monkeypatch.setattr(game_state_module, "CUPY_AVAILABLE", False)
+    with pytest.raises(RuntimeError):
+        calculate_influence_batch([Board(9)], backend='cupy')
@@ -0,0 +1,67 @@
+"""
+Tests for the drawing helpers of the main module.
+"""
+
+import numpy as np
+import pytest
+
+import main
+from game.constants import CELL_SIZE, EMPTY
+from tests.test_game_state import random_game
+
+
+def random_maps(size, seed):
+    """Random influence maps of several scales, with the matching boards."""
+    rng = np.random.default_rng(seed)
+    for scale in (0.05, 0.5, 3.0, 40.0):
+        influence = (rng.standard_normal((size, size)) * scale).astype(np.float32)
+        influence[rng.random((size, size)) < 0.2] = 0
+        board = rng.choice([EMPTY, EMPTY, 1, 2], (size, size)).astype(np.int8)
+        yield influence, board
+    for n_moves in (0, 1, size * 3):
+        game = random_game(size, n_moves, seed)
+        yield game.calculate_influence(), game.board.board
+
+
+@pytest.mark.parametrize("size", [9, 19])
+@pytest.mark.parametrize("seed", range(3))
+def test_influence_squares_match_numpy_fallback(monkeypatch, size, seed):
+    if not main.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+
+    for influence, board in random_maps(size, seed):
+        monkeypatch.setattr(main, "NUMBA_AVAILABLE", True)
+        black, white, squares = main.get_influence_squares(influence, board, 15, 20)
+        monkeypatch.setattr(main, "NUMBA_AVAILABLE", False)
+        expected_black, expected_white, expected = main.get_influence_squares(influence, board, 15, 20)
+
+        np.testing.assert_array_equal(squares, expected)
+        assert black == pytest.approx(expected_black, rel=1e-6)
+        assert white == pytest.approx(expected_white, rel=1e-6)
+
+
+@pytest.mark.parametrize("numba_available", [True, False], ids=["numba", "numpy"])
+def test_influence_squares_geometry(monkeypatch, numba_available):
+    if numba_available and not main.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(main, "NUMBA_AVAILABLE", numba_available)
+
+    influence = np.zeros((9, 9), dtype=np.float32)
+    influence[1, 2] = 2.0    # Strongest black influence
+    influence[3, 4] = -1.0   # White influence
+    influence[5, 6] = 0.05   # Too small to show
+    influence[7, 7] = 1.0    # On a stone
+    board = np.zeros((9, 9), dtype=np.int8)
+    board[7, 7] = 1
+
+    black, white, squares = main.get_influence_squares(influence, board, 0, 0)
+
+    assert black == pytest.approx(3.05)
+    assert white == pytest.approx(1.0)
+    assert squares.dtype == np.int32
+    full = int(CELL_SIZE * 0.9)
+    half = int(CELL_SIZE * np.float32(0.6))
+    assert squares.tolist() == [
+        [2 * CELL_SIZE - full // 2, CELL_SIZE - full // 2, full, 255, 0],
+        [4 * CELL_SIZE - half // 2, 3 * CELL_SIZE - half // 2, half, 177, 255],
+    ]
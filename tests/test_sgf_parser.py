@@ -0,0 +1,111 @@
+"""
+Tests for the SGF parser.
+"""
+
+import glob
+import os
+import re
+
+import pytest
+
+import game.sgf_parser as sgf_parser
+from game.sgf_parser import SGFParser
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+_PATTERNS = ("_WS_RE", "_GAME_TREE_RE", "_PROP_RE", "_VAL_RE", "_NODE_PROP_RE")
+
+
+@pytest.fixture(params=["re", "re2"])
+def regex_engine(request, monkeypatch):
+    """Run a test with the parser's patterns compiled by each regex engine."""
+    engine = re if request.param == "re" else re2
+    if engine is None:
+        pytest.skip("google-re2 is not installed")
+    for name in _PATTERNS:
+        monkeypatch.setattr(sgf_parser, name, engine.compile(getattr(sgf_parser, name).pattern))
+    return request.param
+
+
+def parse(content):
+    return SGFParser().parse_content(content)
+
+
+def test_parses_header_and_moves(regex_engine):
+    result = parse("(;GM[1]FF[4]SZ[9]PB[Alice]PW[Bob]KM[6.5]\n;B[cc];W[gg]\n;B[];W[ab])")
+    assert result['board_size'] == 9
+    assert result['properties']['PB'] == ['Alice']
+    assert result['properties']['KM'] == ['6.5']
+    assert result['moves'] == [('B', 2, 2), ('W', 6, 6), ('B', None, None), ('W', 0, 1)]
+
+
+def test_setup_and_player_properties_are_not_moves(regex_engine):
+    result = parse("(;SZ[19]AB[aa][bb]AW[cc]PB[B]PW[W];B[dd];W[ee])")
+    assert result['properties']['AB'] == ['aa', 'bb']
+    assert result['moves'] == [('B', 3, 3), ('W', 4, 4)]
+
+
+def test_escaped_brackets_stay_inside_values(regex_engine):
+    result = parse(r"(;SZ[9]GN[Game \] one]PB[Back\\slash];B[aa]N[move \] name];W[bb])")
+    assert result['properties']['GN'] == [r'Game \] one']
+    assert result['properties']['PB'] == [r'Back\\slash']
+    assert result['moves'] == [('B', 0, 0), ('W', 1, 1)]
+
+
+def test_multiline_values(regex_engine):
+    result = parse("(;SZ[9]GC[first\nsecond]\n;B[aa]\n)")
+    assert result['properties']['GC'] == ['first second']
+    assert result['moves'] == [('B', 0, 0)]
+
+
+@pytest.mark.parametrize("comment", [
+    "plain",
+    "with ; semicolons ;B[aa] and fake moves",
+    r"with escaped \] brackets ;W[bb]\]",
+    "multi\nline ;B[cc]\n",
+    r"ends with an escaped backslash \\",
+])
+def test_comments_do_not_leak_moves(regex_engine, comment):
+    result = parse(f"(;SZ[9]C[{comment}]PB[Alice];B[dd]C[{comment}];W[ee]C [{comment}])")
+    assert result['properties'] == {'SZ': ['9'], 'PB': ['Alice']}
+    assert result['moves'] == [('B', 3, 3), ('W', 4, 4)]
+
+
+def test_strip_comments_keeps_other_properties():
+    content = r"(;C[a;b\]c]GN[x]C[]C[one][two];B[aa]TC[3]C[ ])"
+    assert sgf_parser._strip_comments(content) == "(;GN[x];B[aa]TC[3])"
+
+
+def test_strip_comments_of_an_unterminated_comment():
+    assert sgf_parser._strip_comments("(;SZ[9];B[aa]C[never closed") == "(;SZ[9];B[aa]"
+
+
+def test_engines_agree_on_the_bundled_records():
+    if re2 is None:
+        pytest.skip("google-re2 is not installed")
+    paths = glob.glob(os.path.join(os.path.dirname(__file__), "..", "records", "**", "*.sgf"), recursive=True)
+    if not paths:
+        pytest.skip("No SGF records in the repository")
+
+    results = {}
+    for engine in (re, re2):
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            for name in _PATTERNS:
+                monkeypatch.setattr(sgf_parser, name, engine.compile(getattr(sgf_parser, name).pattern))
+            results[engine] = [SGFParser().parse_file(path) for path in sorted(paths)]
+    assert results[re] == results[re2]
+
+
+def test_invalid_content():
+    assert parse("no game tree here") is None
+
+
+def test_parse_file_decodes_latin1(tmp_path):
+    path = tmp_path / "game.sgf"
+    path.write_bytes("(;SZ[13]PB[Jos\xe9];B[aa])".encode("iso-8859-1"))
+    result = SGFParser().parse_file(str(path))
+    assert result['board_size'] == 13
+    assert result['properties']['PB'] == ['Jos\xe9']